@@ -14,6 +14,8 @@ resolvers/       – ValueResolver impls (JSON Pointer, …)
 factory.py       – ``build_default_engine``
 """
 
+from typing import TYPE_CHECKING
+
 # -- core ----------------------------------------------------------
 from .core import (
     ExecutionContext,
@@ -41,170 +43,170 @@ from .core import (
     Engine,
     UnescapeRule
 )
-# -- factory -------------------------------------------------------
-from .factory import build_default_engine, build_default_async_engine
-# -- handlers (grouped by logical system) --------------------------
-from .handlers import (
-    # template
-    TemplMatcher,
-    TemplSubstHandler,
-    template_unescape,
-    # special
-    SpecialFn,
-    SpecialMatcher,
-    SpecialResolveHandler,
-    # flow control
-    BreakMatcher,
-    BreakHandler,
-    ContinueMatcher,
-    ContinueHandler,
-    ExitMatcher,
-    ExitHandler,
-    # signals
-    BreakSignal,
-    ContinueSignal,
-    ReturnSignal,
-    ExitSignal,
-    RawValueSignal,
-    # constructs
-    raw_handler,
-    ref_handler,
-    eval_handler,
-    make_cast_handler,
-    and_handler,
-    or_handler,
-    not_handler,
-    gt_handler,
-    gte_handler,
-    lt_handler,
-    lte_handler,
-    eq_handler,
-    ne_handler,
-    in_handler,
-    exists_handler,
-    add_handler,
-    make_add_handler,
-    sub_handler,
-    make_sub_handler,
-    mul_handler,
-    make_mul_handler,
-    div_handler,
-    pow_handler,
-    make_pow_handler,
-    mod_handler,
-    round_handler,
-    str_split_handler,
-    make_str_split_handler,
-    str_join_handler,
-    make_str_join_handler,
-    str_slice_handler,
-    str_upper_handler,
-    str_lower_handler,
-    str_strip_handler,
-    str_lstrip_handler,
-    str_rstrip_handler,
-    str_replace_handler,
-    make_str_replace_handler,
-    str_contains_handler,
-    str_startswith_handler,
-    str_endswith_handler,
-    regex_match_handler,
-    make_regex_match_handler,
-    regex_search_handler,
-    make_regex_search_handler,
-    regex_findall_handler,
-    make_regex_findall_handler,
-    regex_replace_handler,
-    make_regex_replace_handler,
-    regex_groups_handler,
-    make_regex_groups_handler,
-    len_handler,
-    keys_handler,
-    values_handler,
-    items_handler,
-    reverse_handler,
-    slice_handler,
-    flatten_handler,
-    type_handler,
-    sum_handler,
-    avg_handler,
-    min_handler,
-    max_handler,
-    sort_handler,
-    unique_handler,
-    abs_handler,
-    floor_handler,
-    ceil_handler,
-    map_handler,
-    make_map_handler,
-    filter_handler,
-    make_filter_handler,
-    # container
-    ContainerMatcher,
-    RecursiveDescentHandler,
-    # identity
-    IdentityHandler,
-    # ops
-    SetHandler,
-    CopyHandler,
-    DeleteHandler,
-    ForeachHandler,
-    WhileHandler,
-    IfHandler,
-    ExecHandler,
-    UpdateHandler,
-    DistinctHandler,
-    AssertHandler,
-    TryHandler,
-    DeserializeHandler,
-    SerializeHandler,
-    EncodeHandler,
-    DecodeHandler,
-    HashHandler,
-    # function
-    DefMatcher,
-    CallMatcher,
-    DefHandler,
-    CallHandler,
-    RaiseMatcher,
-    RaiseHandler,
-    JPermError,
-    ReturnMatcher,
-    ReturnHandler,
-)
-# -- shared matchers -----------------------------------------------
-from .matchers import (
-    OpMatcher,
-    AlwaysMatcher,
-)
-# -- resolvers -----------------------------------------------------
-from .resolvers import PointerResolver
-# -- processors ----------------------------------------------------
-from .processors import PointerProcessor
-# -- stages --------------------------------------------------------
-from .stages import (
-    AssertShorthandMatcher,
-    AssertShorthandProcessor,
-    DeleteShorthandMatcher,
-    DeleteShorthandProcessor,
-    AssignShorthandMatcher,
-    AssignShorthandProcessor,
-    build_default_shorthand_stages,
-)
-# -- casters -----------------------------------------------------------
-from .casters import BUILTIN_CASTERS
-# -- construct groups --------------------------------------------------
-from .construct_groups import (
-    CORE_HANDLERS,
-    LOGICAL_HANDLERS,
-    COMPARISON_HANDLERS,
-    MATH_HANDLERS,
-    STRING_HANDLERS,
-    REGEX_HANDLERS,
-    ALL_HANDLERS_NO_CAST,
-    get_all_handlers,
-    get_all_handlers_with_limits,
-)
+
+if TYPE_CHECKING:
+    # Eager view of the lazy exports below, for type checkers and IDEs only.
+    from .factory import (
+        build_default_engine, build_default_async_engine,
+    )
+    from .handlers import (
+        TemplMatcher, TemplSubstHandler, template_unescape, template_unescape_str,
+        SpecialFn, SpecialMatcher, SpecialResolveHandler, BreakMatcher, BreakHandler,
+        ContinueMatcher, ContinueHandler, ExitMatcher, ExitHandler, BreakSignal,
+        ContinueSignal, ReturnSignal, ExitSignal, RawValueSignal, raw_handler,
+        ref_handler, eval_handler, make_cast_handler, and_handler, or_handler,
+        not_handler, gt_handler, gte_handler, lt_handler, lte_handler, eq_handler,
+        ne_handler, in_handler, exists_handler, add_handler, make_add_handler,
+        sub_handler, make_sub_handler, mul_handler, make_mul_handler, div_handler,
+        pow_handler, make_pow_handler, mod_handler, round_handler, str_split_handler,
+        make_str_split_handler, str_join_handler, make_str_join_handler,
+        str_slice_handler, str_upper_handler, str_lower_handler, str_strip_handler,
+        str_lstrip_handler, str_rstrip_handler, str_replace_handler,
+        make_str_replace_handler, str_contains_handler, str_startswith_handler,
+        str_endswith_handler, regex_match_handler, make_regex_match_handler,
+        regex_search_handler, make_regex_search_handler, regex_findall_handler,
+        make_regex_findall_handler, regex_replace_handler, make_regex_replace_handler,
+        regex_groups_handler, make_regex_groups_handler, len_handler, keys_handler,
+        values_handler, items_handler, reverse_handler, slice_handler, flatten_handler,
+        type_handler, sum_handler, avg_handler, min_handler, max_handler, sort_handler,
+        unique_handler, abs_handler, floor_handler, ceil_handler, map_handler,
+        make_map_handler, filter_handler, make_filter_handler, ContainerMatcher,
+        RecursiveDescentHandler, IdentityHandler, SetHandler, CopyHandler,
+        DeleteHandler, ForeachHandler, WhileHandler, IfHandler, ExecHandler,
+        UpdateHandler, DistinctHandler, AssertHandler, TryHandler, DeserializeHandler,
+        SerializeHandler, EncodeHandler, DecodeHandler, HashHandler, DefMatcher,
+        CallMatcher, DefHandler, CallHandler, RaiseMatcher, RaiseHandler, JPermError,
+        ReturnMatcher, ReturnHandler,
+    )
+    from .matchers import (
+        OpMatcher, AlwaysMatcher,
+    )
+    from .resolvers import (
+        PointerResolver,
+    )
+    from .processors import (
+        PointerProcessor,
+    )
+    from .stages import (
+        AssertShorthandMatcher, AssertShorthandProcessor, DeleteShorthandMatcher,
+        DeleteShorthandProcessor, AssignShorthandMatcher, AssignShorthandProcessor,
+        build_default_shorthand_stages,
+    )
+    from .casters import (
+        BUILTIN_CASTERS,
+    )
+    from .construct_groups import (
+        CORE_HANDLERS, LOGICAL_HANDLERS, COMPARISON_HANDLERS, MATH_HANDLERS,
+        STRING_HANDLERS, REGEX_HANDLERS, ALL_HANDLERS_NO_CAST, get_all_handlers,
+        get_all_handlers_with_limits,
+    )
+
+# Everything below ``core`` is imported on first attribute access (PEP 562),
+# so ``import j_perm`` does not pull in yaml / jmespath / regex until a
+# handler, the factory or a construct group is actually used.
+_LAZY_EXPORTS = {
+    # factory
+    ".factory": (
+        "build_default_engine", "build_default_async_engine",
+    ),
+    # handlers (grouped by logical system)
+    ".handlers": (
+        # template
+        "TemplMatcher", "TemplSubstHandler", "template_unescape", "template_unescape_str",
+        # special
+        "SpecialFn", "SpecialMatcher", "SpecialResolveHandler",
+        # flow control
+        "BreakMatcher", "BreakHandler", "ContinueMatcher", "ContinueHandler",
+        "ExitMatcher", "ExitHandler",
+        # signals
+        "BreakSignal", "ContinueSignal", "ReturnSignal", "ExitSignal", "RawValueSignal",
+        # constructs
+        "raw_handler", "ref_handler", "eval_handler", "make_cast_handler",
+        "and_handler", "or_handler", "not_handler", "gt_handler", "gte_handler",
+        "lt_handler", "lte_handler", "eq_handler", "ne_handler", "in_handler",
+        "exists_handler", "add_handler", "make_add_handler", "sub_handler",
+        "make_sub_handler", "mul_handler", "make_mul_handler", "div_handler",
+        "pow_handler", "make_pow_handler", "mod_handler", "round_handler",
+        "str_split_handler", "make_str_split_handler", "str_join_handler",
+        "make_str_join_handler", "str_slice_handler", "str_upper_handler",
+        "str_lower_handler", "str_strip_handler", "str_lstrip_handler",
+        "str_rstrip_handler", "str_replace_handler", "make_str_replace_handler",
+        "str_contains_handler", "str_startswith_handler", "str_endswith_handler",
+        "regex_match_handler", "make_regex_match_handler", "regex_search_handler",
+        "make_regex_search_handler", "regex_findall_handler",
+        "make_regex_findall_handler", "regex_replace_handler",
+        "make_regex_replace_handler", "regex_groups_handler",
+        "make_regex_groups_handler", "len_handler", "keys_handler", "values_handler",
+        "items_handler", "reverse_handler", "slice_handler", "flatten_handler",
+        "type_handler", "sum_handler", "avg_handler", "min_handler", "max_handler",
+        "sort_handler", "unique_handler", "abs_handler", "floor_handler",
+        "ceil_handler", "map_handler", "make_map_handler", "filter_handler",
+        "make_filter_handler",
+        # container
+        "ContainerMatcher", "RecursiveDescentHandler",
+        # identity
+        "IdentityHandler",
+        # ops
+        "SetHandler", "CopyHandler", "DeleteHandler", "ForeachHandler", "WhileHandler",
+        "IfHandler", "ExecHandler", "UpdateHandler", "DistinctHandler", "AssertHandler",
+        "TryHandler", "DeserializeHandler", "SerializeHandler", "EncodeHandler",
+        "DecodeHandler", "HashHandler",
+        # function
+        "DefMatcher", "CallMatcher", "DefHandler", "CallHandler", "RaiseMatcher",
+        "RaiseHandler", "JPermError", "ReturnMatcher", "ReturnHandler",
+    ),
+    # shared matchers
+    ".matchers": (
+        "OpMatcher", "AlwaysMatcher",
+    ),
+    # resolvers
+    ".resolvers": (
+        "PointerResolver",
+    ),
+    # processors
+    ".processors": (
+        "PointerProcessor",
+    ),
+    # stages
+    ".stages": (
+        "AssertShorthandMatcher", "AssertShorthandProcessor", "DeleteShorthandMatcher",
+        "DeleteShorthandProcessor", "AssignShorthandMatcher",
+        "AssignShorthandProcessor", "build_default_shorthand_stages",
+    ),
+    # casters
+    ".casters": (
+        "BUILTIN_CASTERS",
+    ),
+    # construct groups
+    ".construct_groups": (
+        "CORE_HANDLERS", "LOGICAL_HANDLERS", "COMPARISON_HANDLERS", "MATH_HANDLERS",
+        "STRING_HANDLERS", "REGEX_HANDLERS", "ALL_HANDLERS_NO_CAST", "get_all_handlers",
+        "get_all_handlers_with_limits",
+    ),
+}
+_LAZY = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+_SUBMODULES = frozenset({
+    "casters", "construct_groups", "factory", "handlers", "matchers",
+    "processors", "resolvers", "stages", "text",
+})
+
+
+def __getattr__(name: str):
+    from importlib import import_module
+
+    if name in _LAZY:
+        value = getattr(import_module(_LAZY[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     # core
@@ -246,6 +248,7 @@ __all__ = [
     "TemplMatcher",
     "TemplSubstHandler",
     "template_unescape",
+    "template_unescape_str",
     "SpecialFn",
     "SpecialMatcher",
     "SpecialResolveHandler",
@@ -7,7 +7,7 @@ template expressions (``${int:...}``) and the ``$cast`` construct
 Exports
 -------
 BUILTIN_CASTERS
-    Dictionary mapping type names to caster functions.
+    Read-only mapping of type names to caster functions.
     Default types: int, float, bool, str.
 
 Custom casters can be registered by passing a custom casters dict to
@@ -16,15 +16,25 @@ Custom casters can be registered by passing a custom casters dict to
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Built-in casters
 # ─────────────────────────────────────────────────────────────────────────────
 
-BUILTIN_CASTERS: dict[str, Callable[[Any], Any]] = {
-    "int": lambda x: int(x),
-    "float": lambda x: float(x),
-    "bool": lambda x: bool(int(x)) if isinstance(x, (int, str)) else bool(x),
-    "str": lambda x: str(x),
-}
+
+def _to_bool(x: Any) -> bool:
+    """``"0"`` / ``0`` → ``False``, ``"1"`` / ``1`` → ``True``; else truthiness."""
+    return bool(int(x)) if isinstance(x, (int, str)) else bool(x)
+
+
+# The builtins are bound directly (no lambda wrapper frame per cast).  The
+# mapping is read-only; build a new dict to add casters:
+# ``{**BUILTIN_CASTERS, "json": json.loads}``.
+BUILTIN_CASTERS: Mapping[str, Callable[[Any], Any]] = MappingProxyType({
+    "int": int,
+    "float": float,
+    "bool": _to_bool,
+    "str": str,
+})
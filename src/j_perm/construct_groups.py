@@ -21,147 +21,143 @@ Example usage::
         "$custom": my_custom_handler,
     })
 """
-from .handlers.constructs import (
-    # Core
-    ref_handler, eval_handler, raw_handler,
-    # Logical
-    and_handler, or_handler, not_handler, if_handler,
-    # Comparison
-    gt_handler, gte_handler, lt_handler, lte_handler, eq_handler, ne_handler, in_handler,
-    exists_handler,
-    # Math
-    add_handler, sub_handler, mul_handler, div_handler, pow_handler, mod_handler, round_handler,
-    # String
-    str_split_handler, str_join_handler, str_slice_handler,
-    str_upper_handler, str_lower_handler,
-    str_strip_handler, str_lstrip_handler, str_rstrip_handler,
-    str_replace_handler, str_contains_handler,
-    str_startswith_handler, str_endswith_handler,
-    # Regex
-    regex_match_handler, regex_search_handler, regex_findall_handler,
-    regex_replace_handler, regex_groups_handler,
-    # Collection / value
-    len_handler, keys_handler, values_handler, items_handler,
-    reverse_handler, slice_handler, flatten_handler, type_handler,
-    sum_handler, avg_handler, min_handler, max_handler,
-    sort_handler, unique_handler,
-    abs_handler, floor_handler, ceil_handler,
-    map_handler, filter_handler,
-)
+from functools import lru_cache
+from types import MappingProxyType
+
+# Bound once as a module alias, so the handler names stay out of this
+# module's globals; only the group tables below reference them.
+from .handlers import constructs as _c
+from .casters import BUILTIN_CASTERS
+
+__all__ = [
+    "CORE_HANDLERS",
+    "LOGICAL_HANDLERS",
+    "COMPARISON_HANDLERS",
+    "MATH_HANDLERS",
+    "STRING_HANDLERS",
+    "REGEX_HANDLERS",
+    "COLLECTION_HANDLERS",
+    "ALL_HANDLERS_NO_CAST",
+    "get_all_handlers",
+    "get_all_handlers_with_limits",
+]
+
+# Every group is a read-only view: the tables are shared by all engines built
+# from them.  Extend by spreading into a new dict, e.g. ``{**CORE_HANDLERS, ...}``.
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Core handlers
 # ─────────────────────────────────────────────────────────────────────────────
 
-CORE_HANDLERS = {
-    "$ref": ref_handler,
-    "$eval": eval_handler,
-    "$raw": raw_handler,
-}
+CORE_HANDLERS = MappingProxyType({
+    "$ref": _c.ref_handler,
+    "$eval": _c.eval_handler,
+    "$raw": _c.raw_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Logical operators
 # ─────────────────────────────────────────────────────────────────────────────
 
-LOGICAL_HANDLERS = {
-    "$and": and_handler,
-    "$or": or_handler,
-    "$not": not_handler,
-    "$if": if_handler,
-}
+LOGICAL_HANDLERS = MappingProxyType({
+    "$and": _c.and_handler,
+    "$or": _c.or_handler,
+    "$not": _c.not_handler,
+    "$if": _c.if_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Comparison operators
 # ─────────────────────────────────────────────────────────────────────────────
 
-COMPARISON_HANDLERS = {
-    "$gt": gt_handler,
-    "$gte": gte_handler,
-    "$lt": lt_handler,
-    "$lte": lte_handler,
-    "$eq": eq_handler,
-    "$ne": ne_handler,
-    "$in": in_handler,
-    "$exists": exists_handler,
-}
+COMPARISON_HANDLERS = MappingProxyType({
+    "$gt": _c.gt_handler,
+    "$gte": _c.gte_handler,
+    "$lt": _c.lt_handler,
+    "$lte": _c.lte_handler,
+    "$eq": _c.eq_handler,
+    "$ne": _c.ne_handler,
+    "$in": _c.in_handler,
+    "$exists": _c.exists_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Mathematical operators
 # ─────────────────────────────────────────────────────────────────────────────
 
-MATH_HANDLERS = {
-    "$add": add_handler,
-    "$sub": sub_handler,
-    "$mul": mul_handler,
-    "$div": div_handler,
-    "$pow": pow_handler,
-    "$mod": mod_handler,
-    "$round": round_handler,
-    "$abs": abs_handler,
-    "$floor": floor_handler,
-    "$ceil": ceil_handler,
-}
+MATH_HANDLERS = MappingProxyType({
+    "$add": _c.add_handler,
+    "$sub": _c.sub_handler,
+    "$mul": _c.mul_handler,
+    "$div": _c.div_handler,
+    "$pow": _c.pow_handler,
+    "$mod": _c.mod_handler,
+    "$round": _c.round_handler,
+    "$abs": _c.abs_handler,
+    "$floor": _c.floor_handler,
+    "$ceil": _c.ceil_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # String operations
 # ─────────────────────────────────────────────────────────────────────────────
 
-STRING_HANDLERS = {
-    "$str_split": str_split_handler,
-    "$str_join": str_join_handler,
-    "$str_slice": str_slice_handler,
-    "$str_upper": str_upper_handler,
-    "$str_lower": str_lower_handler,
-    "$str_strip": str_strip_handler,
-    "$str_lstrip": str_lstrip_handler,
-    "$str_rstrip": str_rstrip_handler,
-    "$str_replace": str_replace_handler,
-    "$str_contains": str_contains_handler,
-    "$str_startswith": str_startswith_handler,
-    "$str_endswith": str_endswith_handler,
-}
+STRING_HANDLERS = MappingProxyType({
+    "$str_split": _c.str_split_handler,
+    "$str_join": _c.str_join_handler,
+    "$str_slice": _c.str_slice_handler,
+    "$str_upper": _c.str_upper_handler,
+    "$str_lower": _c.str_lower_handler,
+    "$str_strip": _c.str_strip_handler,
+    "$str_lstrip": _c.str_lstrip_handler,
+    "$str_rstrip": _c.str_rstrip_handler,
+    "$str_replace": _c.str_replace_handler,
+    "$str_contains": _c.str_contains_handler,
+    "$str_startswith": _c.str_startswith_handler,
+    "$str_endswith": _c.str_endswith_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Regular expression operations
 # ─────────────────────────────────────────────────────────────────────────────
 
-REGEX_HANDLERS = {
-    "$regex_match": regex_match_handler,
-    "$regex_search": regex_search_handler,
-    "$regex_findall": regex_findall_handler,
-    "$regex_replace": regex_replace_handler,
-    "$regex_groups": regex_groups_handler,
-}
+REGEX_HANDLERS = MappingProxyType({
+    "$regex_match": _c.regex_match_handler,
+    "$regex_search": _c.regex_search_handler,
+    "$regex_findall": _c.regex_findall_handler,
+    "$regex_replace": _c.regex_replace_handler,
+    "$regex_groups": _c.regex_groups_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Collection / value operations
 # ─────────────────────────────────────────────────────────────────────────────
 
-COLLECTION_HANDLERS = {
-    "$len": len_handler,
-    "$keys": keys_handler,
-    "$values": values_handler,
-    "$items": items_handler,
-    "$reverse": reverse_handler,
-    "$slice": slice_handler,
-    "$flatten": flatten_handler,
-    "$type": type_handler,
-    "$sum": sum_handler,
-    "$avg": avg_handler,
-    "$min": min_handler,
-    "$max": max_handler,
-    "$sort": sort_handler,
-    "$unique": unique_handler,
-    "$map": map_handler,
-    "$filter": filter_handler,
-}
+COLLECTION_HANDLERS = MappingProxyType({
+    "$len": _c.len_handler,
+    "$keys": _c.keys_handler,
+    "$values": _c.values_handler,
+    "$items": _c.items_handler,
+    "$reverse": _c.reverse_handler,
+    "$slice": _c.slice_handler,
+    "$flatten": _c.flatten_handler,
+    "$type": _c.type_handler,
+    "$sum": _c.sum_handler,
+    "$avg": _c.avg_handler,
+    "$min": _c.min_handler,
+    "$max": _c.max_handler,
+    "$sort": _c.sort_handler,
+    "$unique": _c.unique_handler,
+    "$map": _c.map_handler,
+    "$filter": _c.filter_handler,
+})
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Combined groups
 # ─────────────────────────────────────────────────────────────────────────────
 
 # All handlers except $cast (which requires casters parameter)
-ALL_HANDLERS_NO_CAST = {
+ALL_HANDLERS_NO_CAST = MappingProxyType({
     **CORE_HANDLERS,
     **LOGICAL_HANDLERS,
     **COMPARISON_HANDLERS,
@@ -169,6 +165,12 @@ ALL_HANDLERS_NO_CAST = {
     **STRING_HANDLERS,
     **REGEX_HANDLERS,
     **COLLECTION_HANDLERS,
+})
+
+# Assembled once; get_all_handlers() hands out copies for the default casters
+_DEFAULT_ALL = {
+    **ALL_HANDLERS_NO_CAST,
+    "$cast": _c.make_cast_handler(BUILTIN_CASTERS),
 }
 
 
@@ -191,15 +193,12 @@ def get_all_handlers(casters=None):
         handlers = get_all_handlers(casters=BUILTIN_CASTERS)
         engine = build_default_engine(specials=handlers)
     """
-    from .handlers.constructs import make_cast_handler
-    from .casters import BUILTIN_CASTERS
-
-    resolved_casters = casters if casters is not None else BUILTIN_CASTERS
+    if casters is None:
+        return _DEFAULT_ALL.copy()
 
-    return {
-        **ALL_HANDLERS_NO_CAST,
-        "$cast": make_cast_handler(resolved_casters),
-    }
+    handlers = ALL_HANDLERS_NO_CAST.copy()
+    handlers["$cast"] = _c.make_cast_handler(casters)
+    return handlers
 
 
 def get_all_handlers_with_limits(
@@ -237,7 +236,9 @@ def get_all_handlers_with_limits(
         map_filter_max_items: Maximum number of input elements for $map / $filter.
 
     Returns:
-        Dict of all handler constructs with specified limits.
+        Dict of all handler constructs with specified limits.  The dict is
+        fresh on every call, but handlers built for the same limits are
+        shared between calls.
 
     Example::
 
@@ -250,96 +251,96 @@ def get_all_handlers_with_limits(
         )
         engine = build_default_engine(specials=handlers)
     """
-    from .handlers.constructs import (
-        make_cast_handler,
-        make_add_handler,
-        make_sub_handler,
-        make_mul_handler,
-        make_pow_handler,
-        make_str_split_handler,
-        make_str_join_handler,
-        make_str_replace_handler,
-        make_regex_match_handler,
-        make_regex_search_handler,
-        make_regex_findall_handler,
-        make_regex_replace_handler,
-        make_regex_groups_handler,
-        make_map_handler,
-        make_filter_handler,
-    )
-    from .casters import BUILTIN_CASTERS
-
-    resolved_casters = casters if casters is not None else BUILTIN_CASTERS
-
-    return {
-        **CORE_HANDLERS,
-        **LOGICAL_HANDLERS,
-        **COMPARISON_HANDLERS,
+    handlers = ALL_HANDLERS_NO_CAST.copy()
+    handlers.update(_limited_handlers(
+        regex_timeout, regex_allowed_flags,
+        pow_max_base, pow_max_exponent,
+        mul_max_string_result, mul_max_operand,
+        add_max_number_result, add_max_string_result,
+        sub_max_number_result,
+        str_max_split_results, str_max_join_result, str_max_replace_result,
+        map_filter_max_items,
+    ))
+    if casters is None:
+        handlers["$cast"] = _DEFAULT_ALL["$cast"]
+    else:
+        handlers["$cast"] = _c.make_cast_handler(casters)
+    return handlers
+
+
+@lru_cache(maxsize=32, typed=True)
+def _limited_handlers(
+        regex_timeout,
+        regex_allowed_flags,
+        pow_max_base,
+        pow_max_exponent,
+        mul_max_string_result,
+        mul_max_operand,
+        add_max_number_result,
+        add_max_string_result,
+        sub_max_number_result,
+        str_max_split_results,
+        str_max_join_result,
+        str_max_replace_result,
+        map_filter_max_items,
+):
+    """Build the limit-carrying handlers once per distinct limits tuple.
+
+    The factories are pure in their arguments, so engines built with the same
+    limits share one set of handlers.  The cache is typed: ``1``, ``1.0`` and
+    ``True`` hash alike but reach the handlers as different values (e.g. in
+    error messages), so each gets its own entry.  ``$cast`` is not cached
+    here: its handler closes over the caller's casters mapping.
+    """
+    return MappingProxyType({
         # Math handlers with limits
-        "$add": make_add_handler(
+        "$add": _c.make_add_handler(
             max_number_result=add_max_number_result,
             max_string_result=add_max_string_result,
         ),
-        "$sub": make_sub_handler(
+        "$sub": _c.make_sub_handler(
             max_number_result=sub_max_number_result,
         ),
-        "$mul": make_mul_handler(
+        "$mul": _c.make_mul_handler(
             max_string_result=mul_max_string_result,
             max_operand=mul_max_operand,
         ),
-        "$div": div_handler,
-        "$pow": make_pow_handler(
+        "$pow": _c.make_pow_handler(
             max_base=pow_max_base,
             max_exponent=pow_max_exponent,
         ),
-        "$mod": mod_handler,
-        "$round": round_handler,
-        "$abs": abs_handler,
-        "$floor": floor_handler,
-        "$ceil": ceil_handler,
         # String handlers with limits
-        "$str_split": make_str_split_handler(
+        "$str_split": _c.make_str_split_handler(
             max_results=str_max_split_results,
         ),
-        "$str_join": make_str_join_handler(
+        "$str_join": _c.make_str_join_handler(
             max_result_length=str_max_join_result,
         ),
-        "$str_slice": str_slice_handler,
-        "$str_upper": str_upper_handler,
-        "$str_lower": str_lower_handler,
-        "$str_strip": str_strip_handler,
-        "$str_lstrip": str_lstrip_handler,
-        "$str_rstrip": str_rstrip_handler,
-        "$str_replace": make_str_replace_handler(
+        "$str_replace": _c.make_str_replace_handler(
             max_result_length=str_max_replace_result,
         ),
-        "$str_contains": str_contains_handler,
-        "$str_startswith": str_startswith_handler,
-        "$str_endswith": str_endswith_handler,
         # Regex handlers with limits
-        "$regex_match": make_regex_match_handler(
+        "$regex_match": _c.make_regex_match_handler(
             timeout=regex_timeout,
             allowed_flags=regex_allowed_flags,
         ),
-        "$regex_search": make_regex_search_handler(
+        "$regex_search": _c.make_regex_search_handler(
             timeout=regex_timeout,
             allowed_flags=regex_allowed_flags,
         ),
-        "$regex_findall": make_regex_findall_handler(
+        "$regex_findall": _c.make_regex_findall_handler(
             timeout=regex_timeout,
             allowed_flags=regex_allowed_flags,
         ),
-        "$regex_replace": make_regex_replace_handler(
+        "$regex_replace": _c.make_regex_replace_handler(
             timeout=regex_timeout,
             allowed_flags=regex_allowed_flags,
         ),
-        "$regex_groups": make_regex_groups_handler(
+        "$regex_groups": _c.make_regex_groups_handler(
             timeout=regex_timeout,
             allowed_flags=regex_allowed_flags,
         ),
-        # Collection / value handlers (map/filter carry a size limit)
-        **COLLECTION_HANDLERS,
-        "$map": make_map_handler(max_items=map_filter_max_items),
-        "$filter": make_filter_handler(max_items=map_filter_max_items),
-        "$cast": make_cast_handler(resolved_casters),
-    }
+        # Collection handlers with limits
+        "$map": _c.make_map_handler(max_items=map_filter_max_items),
+        "$filter": _c.make_filter_handler(max_items=map_filter_max_items),
+    })
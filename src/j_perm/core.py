@@ -25,10 +25,16 @@ Execution flow (``Engine.apply`` entry point)::
 from __future__ import annotations
 
 import copy
+import hashlib
 import inspect
+import json
 import logging
+import sys
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
+from operator import attrgetter
 from typing import Any, Callable, List, Optional, Tuple, Union
 
 _log = logging.getLogger("j_perm")
@@ -37,6 +43,27 @@ _log_values = logging.getLogger("j_perm.values")
 # Metadata key for the language-level execution stack
 _LANG_EXEC_STACK_KEY = "_lang_exec_stack"
 
+# Metadata key for the per-run cache of stage-normalised step lists
+_STAGE_CACHE_KEY = "_stage_cache"
+
+# How many spec bodies one run's stage cache keeps (LRU)
+_STAGE_CACHE_SIZE = 64
+
+# Operation limit used when the engine does not define one
+_NO_LIMIT = float("inf")
+
+# Bumped on every stage / action / middleware registration in any pipeline;
+# an Engine drops its memoised results when it changes.
+_registry_generation = 0
+
+
+def _registries_changed() -> None:
+    global _registry_generation
+    _registry_generation += 1
+
+# Sort key for nodes, middlewares and unescape rules (descending priority)
+_priority = attrgetter("priority")
+
 
 def _repr_step(step: Any, max_len: Optional[int] = 200) -> str:
     """Compact human-readable representation of a DSL step for the language call stack.
@@ -82,21 +109,125 @@ def _format_lang_stack(frames: list) -> str:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def _contains_tuple(obj: Any) -> bool:
+    """Return ``True`` if a tuple occurs anywhere inside *obj* (iterative DFS)."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, tuple):
+            return True
+        if isinstance(node, list):
+            stack.extend(node)
+        elif isinstance(node, dict):
+            stack.extend(node.values())
+    return False
+
+
 def _tuples_to_lists(obj: Any) -> Any:
-    """Recursively convert tuples → lists (JMESPath does not see tuples)."""
-    if isinstance(obj, (tuple, list)):
-        return [_tuples_to_lists(x) for x in obj]
+    """Convert tuples → lists (JMESPath does not see tuples).
+
+    Tuple-free input — the common case — is returned as-is without rebuilding
+    a single container; otherwise only the containers on a path to a tuple
+    are rebuilt and tuple-free subtrees are shared with the input.
+    """
+    if not _contains_tuple(obj):
+        return obj
+    return _rebuild_tuples_as_lists(obj)
+
+
+def _rebuild_tuples_as_lists(obj: Any) -> Any:
+    """Return *obj* with every tuple turned into a list (copy-on-write).
+
+    A container is copied only when one of its children changed, so the
+    result is *obj* itself when no tuple occurs below it.
+    """
+    if isinstance(obj, tuple):
+        return [_rebuild_tuples_as_lists(x) for x in obj]
+    if isinstance(obj, list):
+        out = None
+        for i, x in enumerate(obj):
+            y = _rebuild_tuples_as_lists(x)
+            if y is not x:
+                if out is None:
+                    out = list(obj)
+                out[i] = y
+        return obj if out is None else out
     if isinstance(obj, dict):
-        return {k: _tuples_to_lists(v) for k, v in obj.items()}
+        changed = None
+        for k, v in obj.items():
+            w = _rebuild_tuples_as_lists(v)
+            if w is not v:
+                if changed is None:
+                    changed = dict(obj)
+                changed[k] = w
+        return obj if changed is None else changed
     return obj
 
 
+_JSON_ATOMS = frozenset({str, int, float, bool, type(None)})
+
+
+def _clone_json(obj: Any) -> Any:
+    """Deep-copy a JSON-shaped document without ``copy.deepcopy``'s overhead.
+
+    Plain ``dict`` / ``list`` nodes are rebuilt and JSON scalars are shared
+    (they are immutable).  Anything else — tuples, dict subclasses, custom
+    objects — is handed to ``copy.deepcopy`` so exotic values keep their
+    usual copy semantics.  No memo is kept: JSON documents are trees, so
+    aliased sub-objects in the input come out as independent copies.
+    """
+    cls = type(obj)
+    if cls is dict:
+        return {k: v if type(v) in _JSON_ATOMS else _clone_json(v) for k, v in obj.items()}
+    if cls is list:
+        return [v if type(v) in _JSON_ATOMS else _clone_json(v) for v in obj]
+    if cls in _JSON_ATOMS:
+        return obj
+    return copy.deepcopy(obj)
+
+
+def _is_plain_json(obj: Any) -> bool:
+    """Return ``True`` if *obj* is built only from plain JSON types.
+
+    Only ``dict`` (with ``str`` keys), ``list`` and JSON scalars qualify —
+    exactly the values whose ``json.dumps`` text identifies them uniquely.
+    """
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        cls = type(node)
+        if cls is dict:
+            for k in node:
+                if type(k) is not str:
+                    return False
+            stack.extend(node.values())
+        elif cls is list:
+            stack.extend(node)
+        elif cls not in _JSON_ATOMS:
+            return False
+    return True
+
+
+def _json_fingerprint(*docs: Any) -> Optional[bytes]:
+    """Return a content digest of *docs*, or ``None`` if any is not plain JSON.
+
+    Keys are serialised in insertion order: ``$keys``, ``foreach`` over a dict
+    and the output itself all observe key order, so reordered inputs must
+    not share a digest.
+    """
+    for doc in docs:
+        if not _is_plain_json(doc):
+            return None
+    text = json.dumps(docs, separators=(",", ":"))
+    return hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # ExecutionContext
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionContext:
     """Shared mutable state threaded through an entire ``apply`` call.
 
@@ -138,14 +269,18 @@ class ExecutionContext:
         Handy for preparing an isolated sub-context before calling
         ``Engine.run_pipeline`` (e.g. ``ctx.copy(deepcopy_dest=True)`` so the
         named pipeline cannot mutate the caller's document).
+
+        The document-shaped fields (source, dest, temp stores) are cloned with
+        ``_clone_json``; metadata, which holds engine-internal objects, keeps
+        ``copy.deepcopy`` semantics.
         """
         return ExecutionContext(
-            source=new_source if new_source is not None else (copy.deepcopy(self.source) if deepcopy_source else self.source),
-            dest=new_dest if new_dest is not None else (copy.deepcopy(self.dest) if deepcopy_dest else self.dest),
+            source=new_source if new_source is not None else (_clone_json(self.source) if deepcopy_source else self.source),
+            dest=new_dest if new_dest is not None else (_clone_json(self.dest) if deepcopy_dest else self.dest),
             engine=new_engine if new_engine is not None else self.engine,
             metadata=new_metadata if new_metadata is not None else (copy.deepcopy(self.metadata) if deepcopy_metadata else self.metadata),
-            temp_read_only=new_temp_read_only if new_temp_read_only is not None else (copy.deepcopy(self.temp_read_only) if deepcopy_temp_read_only else self.temp_read_only),
-            temp=new_temp if new_temp is not None else (copy.deepcopy(self.temp) if deepcopy_temp else self.temp),
+            temp_read_only=new_temp_read_only if new_temp_read_only is not None else (_clone_json(self.temp_read_only) if deepcopy_temp_read_only else self.temp_read_only),
+            temp=new_temp if new_temp is not None else (_clone_json(self.temp) if deepcopy_temp else self.temp),
         )
 
 
@@ -270,7 +405,7 @@ class AsyncStageProcessor(ABC):
         """Return the (possibly transformed) step list asynchronously."""
 
 
-@dataclass
+@dataclass(slots=True)
 class StageNode:
     """Single node in the stage tree.
 
@@ -305,13 +440,33 @@ class StageRegistry:
     """
 
     def __init__(self) -> None:
+        # Kept sorted by descending priority; the sort is stable, so equal
+        # priorities stay in registration order.
         self._nodes: List[StageNode] = []
+        # False once any node's matcher or processor is ``context_aware``;
+        # mounted child registries are checked through _groups.
+        self._context_free = True
+        self._groups: List['StageRegistry'] = []
 
     # -- registration ------------------------------------------------------
 
     def register(self, node: StageNode) -> None:
         """Add a node to this registry level."""
         self._nodes.append(node)
+        self._nodes.sort(key=_priority, reverse=True)
+        if (getattr(node.matcher, 'context_aware', False)
+                or getattr(node.processor, 'context_aware', False)):
+            self._context_free = False
+        if node.children is not None:
+            self._groups.append(node.children)
+        _registries_changed()
+
+    def _is_context_free(self) -> bool:
+        """``True`` if no stage at this level or in any mounted group is
+        ``context_aware``.  Groups are asked on every call, so stages
+        registered into a child registry after mounting are seen too.
+        """
+        return self._context_free and all(g._is_context_free() for g in self._groups)
 
     def register_group(
             self,
@@ -339,7 +494,7 @@ class StageRegistry:
 
         Returns the fully transformed step list.
         """
-        for node in sorted(self._nodes, key=lambda n: n.priority, reverse=True):
+        for node in self._nodes:
             if node.matcher is None or node.matcher.matches(steps, ctx):
                 if node.children is not None:
                     steps = node.children.run_all(steps, ctx)
@@ -351,7 +506,7 @@ class StageRegistry:
 
     def nodes(self) -> List[StageNode]:
         """Return nodes sorted by descending priority."""
-        return sorted(self._nodes, key=lambda n: n.priority, reverse=True)
+        return list(self._nodes)
 
     # -- async execution ----------------------------------------------------
 
@@ -361,7 +516,7 @@ class StageRegistry:
         For AsyncStageProcessor instances, awaits them. For sync processors,
         calls them directly. Returns the fully transformed step list.
         """
-        for node in sorted(self._nodes, key=lambda n: n.priority, reverse=True):
+        for node in self._nodes:
             if node.matcher is None or node.matcher.matches(steps, ctx):
                 if node.children is not None:
                     steps = await node.children.run_all_async(steps, ctx)
@@ -494,8 +649,16 @@ class ActionMatcher(ABC):
 
         OpMatcher("set")     → step.get("op") == "set"
         AlwaysMatcher()      → True
+
+    Set ``op_key`` to a string if ``matches`` can only be true for mappings
+    whose ``"op"`` equals it.  ``ActionTypeRegistry.resolve`` then skips the
+    node for every other step without calling ``matches``.  The key is read
+    once, when the registry builds its dispatch tables, so it must not change
+    after the matcher is registered.
     """
 
+    op_key: Optional[str] = None
+
     @abstractmethod
     def matches(self, step: Any) -> bool: ...
 
@@ -505,8 +668,14 @@ class ActionHandler(ABC):
 
     The handler is responsible for calling ``ctx.engine.process_value(…)``
     whenever it needs a substituted value — there is no automatic pre-pass.
+
+    Set ``passthrough = True`` in a subclass if ``execute`` always returns
+    *step* unchanged.  ``Engine.process_value`` then returns scalar values
+    that resolve only to such handlers without running the value pipeline.
     """
 
+    passthrough: bool = False
+
     @abstractmethod
     def execute(self, step: Any, ctx: ExecutionContext) -> Any:
         """Run the action.  Return the new ``dest``."""
@@ -599,7 +768,7 @@ class Compound(ABC):
         return await result if inspect.isawaitable(result) else result
 
 
-@dataclass
+@dataclass(slots=True)
 class ActionNode:
     """Node in the action-type tree.
 
@@ -618,6 +787,9 @@ class ActionNode:
     The *fallback* rule: ``handler`` is only selected when
     ``children.resolve()`` returns an empty list.  If children matched,
     the parent handler is skipped entirely.
+
+    The owning registry builds its dispatch tables from ``matcher.op_key``,
+    so do not swap ``matcher`` on a registered node; register a new one.
     """
 
     name: str
@@ -647,13 +819,22 @@ class ActionTypeRegistry:
     """
 
     def __init__(self) -> None:
+        # Kept sorted by descending priority; the sort is stable, so equal
+        # priorities stay in registration order.
         self._nodes: List[ActionNode] = []
+        # op → candidate nodes, plus the nodes for any other step; built
+        # lazily by _candidates() and dropped on register.
+        self._by_op: Optional[dict[str, List[ActionNode]]] = None
+        self._general: List[ActionNode] = []
 
     # -- registration -------------------------------------------------------
 
     def register(self, node: ActionNode) -> None:
         """Add a node to this registry level."""
         self._nodes.append(node)
+        self._nodes.sort(key=_priority, reverse=True)
+        self._by_op = None
+        _registries_changed()
 
     def register_group(
             self,
@@ -696,7 +877,7 @@ class ActionTypeRegistry:
                     if exclusive and list non-empty → break
         """
         handlers: List[ActionHandler] = []
-        for node in sorted(self._nodes, key=lambda n: n.priority, reverse=True):
+        for node in self._candidates(step):
             if node.matcher.matches(step):
                 node_resolved = False
                 if node.children is not None:
@@ -710,6 +891,35 @@ class ActionTypeRegistry:
                     break
         return handlers
 
+    def _candidates(self, step: Any) -> List[ActionNode]:
+        """Return the nodes that may match *step*, in priority order.
+
+        Nodes whose matcher declares an ``op_key`` are kept only for steps
+        with that ``"op"``; every other node is always a candidate.  Table
+        keys are interned so literal op names hit on identity.
+
+        The tables are rebuilt only by ``register``: replacing a registered
+        node's ``matcher`` is not seen here.  Register a new node instead.
+        """
+        by_op = self._by_op
+        if by_op is None:
+            by_op = {}
+            for node in self._nodes:
+                key = node.matcher.op_key
+                if key is not None:
+                    by_op.setdefault(sys.intern(key), [])
+            for key, plan in by_op.items():
+                plan.extend(n for n in self._nodes if n.matcher.op_key in (None, key))
+            self._general = [n for n in self._nodes if n.matcher.op_key is None]
+            self._by_op = by_op
+        if isinstance(step, Mapping):
+            op = step.get("op")
+            if isinstance(op, str):
+                plan = by_op.get(op)
+                if plan is not None:
+                    return plan
+        return self._general
+
     # -- dispatch (run-all) -------------------------------------------------
 
     def run_all(self, step: Any, ctx: ExecutionContext) -> Any:
@@ -721,7 +931,7 @@ class ActionTypeRegistry:
 
         Returns the final ``ctx.dest``.
         """
-        for node in sorted(self._nodes, key=lambda n: n.priority, reverse=True):
+        for node in self._nodes:
             if node.matcher.matches(step):
                 if node.children is not None:
                     ctx.dest = node.children.run_all(step, ctx)
@@ -733,7 +943,7 @@ class ActionTypeRegistry:
 
     def nodes(self) -> List[ActionNode]:
         """Return nodes sorted by descending priority."""
-        return sorted(self._nodes, key=lambda n: n.priority, reverse=True)
+        return list(self._nodes)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -741,7 +951,7 @@ class ActionTypeRegistry:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class CompiledStep:
     """A single step that has been fully resolved during compilation.
 
@@ -815,9 +1025,8 @@ class CompiledSpec:
 
         Returns a deep copy of ``ctx.dest`` after execution.
         """
-        pipeline = self._pipeline if self._pipeline is not None else ctx.engine.main_pipeline
-        pipeline.run_compiled(self, ctx)
-        return copy.deepcopy(ctx.dest)
+        self.run_in_place(ctx)
+        return _clone_json(ctx.dest)
 
     async def run_async(self, ctx: 'ExecutionContext') -> Any:
         """Async version of :meth:`run`.
@@ -826,9 +1035,22 @@ class CompiledSpec:
         ``AsyncActionHandler`` reached through the compiled steps (directly or
         inside compound bodies) is awaited.  Returns a deep copy of ``ctx.dest``.
         """
+        await self.run_in_place_async(ctx)
+        return _clone_json(ctx.dest)
+
+    def run_in_place(self, ctx: 'ExecutionContext') -> None:
+        """Like :meth:`run`, but leave the result in ``ctx.dest`` without copying it.
+
+        For compound handlers that keep working on the same context after the
+        nested body finishes.
+        """
+        pipeline = self._pipeline if self._pipeline is not None else ctx.engine.main_pipeline
+        pipeline.run_compiled(self, ctx)
+
+    async def run_in_place_async(self, ctx: 'ExecutionContext') -> None:
+        """Async version of :meth:`run_in_place`."""
         pipeline = self._pipeline if self._pipeline is not None else ctx.engine.main_pipeline
         await pipeline.run_compiled_async(self, ctx)
-        return copy.deepcopy(ctx.dest)
 
     def apply(
             self,
@@ -836,6 +1058,7 @@ class CompiledSpec:
             source: Any,
             dest: Any,
             engine: Optional['Engine'] = None,
+            copy_result: bool = True,
     ) -> Any:
         """Execute the compiled script with the given *source* and *dest*.
 
@@ -844,6 +1067,7 @@ class CompiledSpec:
             dest:   Starting destination document (deep-copied before use).
             engine: Override the stored engine.  Required if the object was
                     unpickled without calling :meth:`attach_engine` first.
+            copy_result: See :meth:`Engine.apply`.
 
         Returns:
             Deep copy of the final ``dest`` after execution.
@@ -854,7 +1078,7 @@ class CompiledSpec:
                 "CompiledSpec has no engine attached. "
                 "Call attach_engine() or pass engine= to apply()."
             )
-        return eng.apply_compiled(self, source=source, dest=dest)
+        return eng.apply_compiled(self, source=source, dest=dest, copy_result=copy_result)
 
     async def apply_async(
             self,
@@ -862,6 +1086,7 @@ class CompiledSpec:
             source: Any,
             dest: Any,
             engine: Optional['Engine'] = None,
+            copy_result: bool = True,
     ) -> Any:
         """Async version of :meth:`apply`."""
         eng = engine or self._engine
@@ -870,7 +1095,7 @@ class CompiledSpec:
                 "CompiledSpec has no engine attached. "
                 "Call attach_engine() or pass engine= to apply_async()."
             )
-        return await eng.apply_compiled_async(self, source=source, dest=dest)
+        return await eng.apply_compiled_async(self, source=source, dest=dest, copy_result=copy_result)
 
     def attach_engine(self, engine: 'Engine') -> 'CompiledSpec':
         """Set the engine reference and return *self* for chaining."""
@@ -929,7 +1154,8 @@ class Pipeline:
     ) -> None:
         self.registry = registry or ActionTypeRegistry()
         self.stages = stages or StageRegistry()
-        self._middlewares = list(middlewares) if middlewares else []
+        # Kept sorted by descending priority (stable for equal priorities)
+        self._middlewares = sorted(middlewares, key=_priority, reverse=True) if middlewares else []
         self.track_execution = track_execution
 
     # -- registration -------------------------------------------------------
@@ -937,32 +1163,120 @@ class Pipeline:
     def register_middleware(self, middleware: Middleware) -> None:
         """Add a per-step middleware."""
         self._middlewares.append(middleware)
+        self._middlewares.sort(key=_priority, reverse=True)
+        _registries_changed()
+
+    # -- stage normalisation ----------------------------------------------------
+
+    def _stages_context_free(self) -> bool:
+        """``True`` if no stage matcher or processor declares ``context_aware``,
+        including those inside ``register_group`` child registries.
+
+        Tracked by ``StageRegistry.register``, so this is a flag read per
+        registry level.
+        """
+        return self.stages._is_context_free()
+
+    def _stage_cache(self, ctx: ExecutionContext) -> Optional[dict]:
+        """Return the per-run stage cache in ``ctx.metadata``, or ``None``.
+
+        Stage output depends only on the spec when every stage is context-free,
+        so within one run a nested body (``foreach.do``, ``if.then``, …) needs
+        normalising once, not on every iteration.  The cache lives in metadata
+        and therefore dies with the run: specs edited between runs are safe.
+        Within a run, an entry is reused only while the spec still equals the
+        snapshot taken when it was stored, so a body edited in place (e.g. one
+        read from ``dest``) is normalised afresh.  The cache is an LRU of
+        ``_STAGE_CACHE_SIZE`` specs, and a spec is only snapshotted the second
+        time it is run, so bodies built afresh on every iteration cost nothing.
+        """
+        if not self.stages._nodes or not self._stages_context_free():
+            return None
+        cache = ctx.metadata.get(_STAGE_CACHE_KEY)
+        if cache is None:
+            cache = ctx.metadata[_STAGE_CACHE_KEY] = OrderedDict()
+        return cache
+
+    def _cached_steps(self, cache: Optional[dict], spec: Any) -> Tuple[Optional[List[Any]], Optional[List[Any]]]:
+        """Look *spec* up in *cache*; entries hold the spec, so ids cannot alias,
+        and a snapshot of it, so in-place edits miss.
+
+        Returns ``(steps, bound)`` — ``bound`` being the handler list of each
+        step, or ``None`` if handlers must be resolved per step — or
+        ``(None, None)`` on a miss.
+        """
+        if cache is None:
+            return None, None
+        key = (id(self), id(spec))
+        entry = cache.get(key)
+        if entry is not None and len(entry) == 4 and entry[0] is spec and entry[1] == spec:
+            cache.move_to_end(key)
+            return entry[2], entry[3]
+        return None, None
+
+    def _store_steps(self, cache: dict, spec: Any, steps: List[Any]) -> Optional[List[Any]]:
+        """Cache *steps* for *spec* and return their pre-resolved handlers.
+
+        The first time a spec is seen only a reference to it is kept; it is
+        snapshotted and its steps cached once it comes round again.  Handlers
+        are bound up front only when no middleware can rewrite a step before
+        dispatch; an unhandled step binds to ``[]`` and still raises when
+        execution reaches it.
+        """
+        key = (id(self), id(spec))
+        entry = cache.pop(key, None)
+        if entry is None or entry[0] is not spec:
+            cache[key] = (spec,)
+            bound = None
+        else:
+            bound = None if self._middlewares else [self.registry.resolve(step) for step in steps]
+            cache[key] = (spec, _clone_json(spec), steps, bound)
+        if len(cache) > _STAGE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return bound
 
     # -- execution ----------------------------------------------------------
 
-    def run(self, spec: Any, ctx: ExecutionContext) -> None:
+    def run(self, spec: Any, ctx: ExecutionContext, *, _bound: Optional[List[Any]] = None) -> None:
         """Run the pipeline.  Context is created/owned by Engine.
 
         *spec* is either a single step or a list of steps.  For the
         value_pipeline the Engine wraps the value in ``[value]`` so that a
         list-typed value is not mistakenly unpacked into multiple steps.
 
+        ``_bound`` (internal) carries the handler list of each step of the
+        list *spec* when the caller has already resolved them; it is only
+        valid for a pipeline without stages or middlewares.
+
         After ``run`` returns, the result lives in ``ctx.dest``.
         """
-        steps: List[Any] = spec if isinstance(spec, list) else [spec]
-        steps = self.stages.run_all(steps, ctx)
-
-        for step in steps:
-            for mw in sorted(self._middlewares, key=lambda m: m.priority, reverse=True):
-                step = mw.process(step, ctx)
-
-            handlers = self.registry.resolve(step)
+        if _bound is not None:
+            steps, bound = spec, _bound
+        else:
+            cache = self._stage_cache(ctx)
+            steps, bound = self._cached_steps(cache, spec)
+            if steps is None:
+                steps = spec if isinstance(spec, list) else [spec]
+                if self.stages._nodes:
+                    steps = self.stages.run_all(steps, ctx)
+                if cache is not None:
+                    bound = self._store_steps(cache, spec, steps)
+            if self._middlewares:
+                bound = None
+
+        max_ops = getattr(ctx.engine, 'max_operations', _NO_LIMIT)
+        for i, step in enumerate(steps):
+            if bound is not None:
+                handlers = bound[i]
+            else:
+                for mw in self._middlewares:
+                    step = mw.process(step, ctx)
+                handlers = self.registry.resolve(step)
             if not handlers:
                 raise ValueError(f"unhandled step: {step!r}")
             for handler in handlers:
                 # Increment operation counter
                 ctx.metadata['_operation_count'] = ctx.metadata.get('_operation_count', 0) + 1
-                max_ops = getattr(ctx.engine, 'max_operations', float('inf'))
                 if ctx.metadata['_operation_count'] > max_ops:
                     raise RuntimeError(
                         f"Operation limit exceeded: {ctx.metadata['_operation_count']} operations executed, "
@@ -996,34 +1310,48 @@ class Pipeline:
 
     # -- async execution ----------------------------------------------------
 
-    async def run_async(self, spec: Any, ctx: ExecutionContext) -> None:
+    async def run_async(self, spec: Any, ctx: ExecutionContext, *, _bound: Optional[List[Any]] = None) -> None:
         """Run the pipeline asynchronously.
 
         Supports async stages, middlewares, and handlers. Sync components
         are called directly, async components are awaited.
 
-        *spec* is either a single step or a list of steps.
+        *spec* is either a single step or a list of steps; ``_bound`` is as
+        in :meth:`run`.
         After ``run_async`` returns, the result lives in ``ctx.dest``.
         """
-        steps: List[Any] = spec if isinstance(spec, list) else [spec]
-        # Use async version of stages if any are async
-        steps = await self.stages.run_all_async(steps, ctx)
-
-        for step in steps:
-            # Process middlewares (check if async)
-            for mw in sorted(self._middlewares, key=lambda m: m.priority, reverse=True):
-                if isinstance(mw, AsyncMiddleware):
-                    step = await mw.process(step, ctx)
-                else:
-                    step = mw.process(step, ctx)
-
-            handlers = self.registry.resolve(step)
+        if _bound is not None:
+            steps, bound = spec, _bound
+        else:
+            cache = self._stage_cache(ctx)
+            steps, bound = self._cached_steps(cache, spec)
+            if steps is None:
+                # Use async version of stages if any are async
+                steps = spec if isinstance(spec, list) else [spec]
+                if self.stages._nodes:
+                    steps = await self.stages.run_all_async(steps, ctx)
+                if cache is not None:
+                    bound = self._store_steps(cache, spec, steps)
+            if self._middlewares:
+                bound = None
+
+        max_ops = getattr(ctx.engine, 'max_operations', _NO_LIMIT)
+        for i, step in enumerate(steps):
+            if bound is not None:
+                handlers = bound[i]
+            else:
+                # Process middlewares (check if async)
+                for mw in self._middlewares:
+                    if isinstance(mw, AsyncMiddleware):
+                        step = await mw.process(step, ctx)
+                    else:
+                        step = mw.process(step, ctx)
+                handlers = self.registry.resolve(step)
             if not handlers:
                 raise ValueError(f"unhandled step: {step!r}")
             for handler in handlers:
                 # Increment operation counter
                 ctx.metadata['_operation_count'] = ctx.metadata.get('_operation_count', 0) + 1
-                max_ops = getattr(ctx.engine, 'max_operations', float('inf'))
                 if ctx.metadata['_operation_count'] > max_ops:
                     raise RuntimeError(
                         f"Operation limit exceeded: {ctx.metadata['_operation_count']} operations executed, "
@@ -1072,11 +1400,8 @@ class Pipeline:
         Returns ``None`` if any stage matcher or processor in this pipeline has
         ``context_aware = True`` (compilation requires context-independent stages).
         """
-        for node in self.stages.nodes():
-            if node.matcher is not None and getattr(node.matcher, 'context_aware', False):
-                return None
-            if node.processor is not None and getattr(node.processor, 'context_aware', False):
-                return None
+        if not self._stages_context_free():
+            return None
 
         original_spec = spec
         steps: List[Any] = spec if isinstance(spec, list) else [spec]
@@ -1113,15 +1438,15 @@ class Pipeline:
             Middlewares that change the dispatch key of a step (``op``, ``$def``,
             ``$func``, etc.) are incompatible with compiled pipelines.
         """
+        max_ops = getattr(ctx.engine, 'max_operations', _NO_LIMIT)
         for compiled_step in compiled.steps:
             step = compiled_step.step
 
-            for mw in sorted(self._middlewares, key=lambda m: m.priority, reverse=True):
+            for mw in self._middlewares:
                 step = mw.process(step, ctx)
 
             for handler in compiled_step.handlers:
                 ctx.metadata['_operation_count'] = ctx.metadata.get('_operation_count', 0) + 1
-                max_ops = getattr(ctx.engine, 'max_operations', float('inf'))
                 if ctx.metadata['_operation_count'] > max_ops:
                     raise RuntimeError(
                         f"Operation limit exceeded: {ctx.metadata['_operation_count']} operations executed, "
@@ -1139,7 +1464,7 @@ class Pipeline:
                     lang_stack = None
 
                 try:
-                    if isinstance(handler, Compound) and compiled_step.nested:
+                    if compiled_step.nested and isinstance(handler, Compound):
                         ctx.dest = handler.execute_compiled(step, ctx, compiled_step.nested)
                     else:
                         ctx.dest = handler.execute(step, ctx)
@@ -1157,10 +1482,11 @@ class Pipeline:
 
     async def run_compiled_async(self, compiled: 'CompiledSpec', ctx: 'ExecutionContext') -> None:
         """Async version of :meth:`run_compiled`."""
+        max_ops = getattr(ctx.engine, 'max_operations', _NO_LIMIT)
         for compiled_step in compiled.steps:
             step = compiled_step.step
 
-            for mw in sorted(self._middlewares, key=lambda m: m.priority, reverse=True):
+            for mw in self._middlewares:
                 if isinstance(mw, AsyncMiddleware):
                     step = await mw.process(step, ctx)
                 else:
@@ -1168,7 +1494,6 @@ class Pipeline:
 
             for handler in compiled_step.handlers:
                 ctx.metadata['_operation_count'] = ctx.metadata.get('_operation_count', 0) + 1
-                max_ops = getattr(ctx.engine, 'max_operations', float('inf'))
                 if ctx.metadata['_operation_count'] > max_ops:
                     raise RuntimeError(
                         f"Operation limit exceeded: {ctx.metadata['_operation_count']} operations executed, "
@@ -1186,7 +1511,7 @@ class Pipeline:
                     lang_stack = None
 
                 try:
-                    if isinstance(handler, Compound) and compiled_step.nested:
+                    if compiled_step.nested and isinstance(handler, Compound):
                         ctx.dest = await handler.execute_compiled_async(step, ctx, compiled_step.nested)
                     elif isinstance(handler, AsyncActionHandler):
                         ctx.dest = await handler.execute(step, ctx)
@@ -1210,7 +1535,7 @@ class Pipeline:
 # ─────────────────────────────────────────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class UnescapeRule:
     """A single unescape pass applied after the value-stabilisation loop.
 
@@ -1224,11 +1549,75 @@ class UnescapeRule:
         priority: Higher = runs first.  Use 0 as baseline.
         unescape: ``value → value`` — must recurse into containers itself
                   (see ``handlers.template.template_unescape`` for an example).
+        leaf:     Optional ``str → str``.  Give it when *unescape* is exactly
+                  "apply *leaf* to every string value and string dict key";
+                  Engine then runs *leaf* through its own walk instead of
+                  *unescape*, fusing adjacent such rules into a single walk.
     """
 
     name: str
     priority: int
     unescape: Callable[[Any], Any]
+    leaf: Optional[Callable[[str], str]] = None
+
+
+def _map_str_leaves(fn: Callable[[str], str], obj: Any) -> Any:
+    """Apply *fn* to every string in *obj*, including string dict keys.
+
+    Lists and mappings are rebuilt (mappings as ``dict``), tuples stay tuples;
+    every other value passes through unchanged.
+    """
+    if isinstance(obj, str):
+        return fn(obj)
+    if isinstance(obj, list):
+        return [_map_str_leaves(fn, x) for x in obj]
+    if isinstance(obj, tuple):
+        return tuple(_map_str_leaves(fn, x) for x in obj)
+    if isinstance(obj, Mapping):
+        return {
+            fn(k) if isinstance(k, str) else k: _map_str_leaves(fn, v)
+            for k, v in obj.items()
+        }
+    return obj
+
+
+def _unescape_passes(rules: List[UnescapeRule]) -> List[Callable[[Any], Any]]:
+    """Turn priority-ordered *rules* into the passes ``process_value`` runs.
+
+    Runs of adjacent ``leaf`` rules collapse into one ``_map_str_leaves`` walk
+    that applies their leaf functions in order; every other rule stays its own
+    pass.  That walk rebuilds every container, which is what keeps resolved
+    values from aliasing source or the spec; when no rule has a ``leaf``, a
+    ``_clone_json`` pass runs first instead, so custom rules need not copy.
+    """
+    passes: List[Callable[[Any], Any]] = []
+    run: List[UnescapeRule] = []
+
+    def flush() -> None:
+        if not run:
+            return
+        leaves = tuple(r.leaf for r in run)
+        if len(leaves) == 1:
+            leaf = leaves[0]
+        else:
+            def leaf(text: str) -> str:
+                for f in leaves:
+                    text = f(text)
+                return text
+
+        passes.append(lambda obj: _map_str_leaves(leaf, obj))
+        run.clear()
+
+    for rule in rules:
+        if rule.leaf is not None:
+            run.append(rule)
+        else:
+            flush()
+            passes.append(rule.unescape)
+    flush()
+    if not any(rule.leaf is not None for rule in rules):
+        passes.insert(0, _clone_json)
+    return passes
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1271,6 +1660,8 @@ class Engine:
             max_function_recursion_depth: int = 100,
             trace_logging: bool = False,
             trace_repr_max: Optional[int] = 200,
+            compile_cache_size: int = 0,
+            result_cache_size: int = 0,
     ) -> None:
         self.resolver = resolver
         self.processor = processor
@@ -1280,13 +1671,31 @@ class Engine:
         self.max_operations = max_operations
         self.max_function_recursion_depth = max_function_recursion_depth
         self._pipelines = dict(pipelines) if pipelines else {}
-        self._unescape_rules = sorted(unescape_rules or [], key=lambda r: r.priority, reverse=True)
+        # A tuple, so rules can only change through register_unescape_rule(),
+        # which keeps the precomputed passes in step with them.
+        self._unescape_rules: Tuple[UnescapeRule, ...] = tuple(
+            sorted(unescape_rules or [], key=_priority, reverse=True)
+        )
+        self._unescape_passes = _unescape_passes(list(self._unescape_rules))
         self.trace_logging = trace_logging
         """If ``True``, emit a ``DEBUG`` log line for every main-pipeline step as it executes."""
         self.trace_repr_max = trace_repr_max
         """Max characters per step in the language call stack / trace output.
         ``None`` disables truncation and shows each step in full.
         """
+        self.compile_cache_size = compile_cache_size
+        """How many specs ``apply`` / ``apply_async`` keep compiled (LRU).
+        ``0`` disables the cache and every call interprets *spec* from scratch.
+        Ignored while the main pipeline has middlewares, which may change a
+        step's dispatch and so cannot run over pre-resolved handlers.
+        """
+        self._compile_cache: OrderedDict[int, Tuple[Any, Optional[CompiledSpec]]] = OrderedDict()
+        self.result_cache_size = result_cache_size
+        """How many ``apply`` / ``apply_async`` results are memoised (LRU).
+        Only safe for side-effect-free specs; ``0`` disables the cache.
+        """
+        self._result_cache: OrderedDict[Tuple[int, bytes], Tuple[Any, Any]] = OrderedDict()
+        self._result_generation = _registry_generation
         for name, func in (custom_functions or {}).items():
             setattr(self, name, func)
 
@@ -1295,6 +1704,8 @@ class Engine:
     def register_pipeline(self, name: str, pipeline: Pipeline) -> None:
         """Register a named pipeline (callable via ``run_pipeline``)."""
         self._pipelines[name] = pipeline
+        self._compile_cache.clear()
+        self._result_cache.clear()
 
     def get_pipeline(self, name: str) -> Pipeline:
         """Return the named pipeline registered under *name*.
@@ -1309,6 +1720,23 @@ class Engine:
     def register_custom_function(self, name: str, func: Callable[[Any], Any]) -> None:
         """Add a custom function as an Engine method (callable from handlers)."""
         setattr(self, name, func)
+        self._result_cache.clear()
+
+    def register_unescape_rule(self, rule: UnescapeRule) -> None:
+        """Add an unescape rule and rebuild the passes ``process_value`` runs.
+
+        Rules stay in descending priority order; equal priorities keep
+        registration order.
+        """
+        rules = sorted([*self._unescape_rules, rule], key=_priority, reverse=True)
+        self._unescape_rules = tuple(rules)
+        self._unescape_passes = _unescape_passes(rules)
+        self._result_cache.clear()
+
+    @property
+    def unescape_rules(self) -> Tuple[UnescapeRule, ...]:
+        """The registered unescape rules in the order they run (read-only)."""
+        return self._unescape_rules
 
     # -- compilation --------------------------------------------------------
 
@@ -1335,20 +1763,92 @@ class Engine:
             compiled._engine = self
         return compiled
 
-    def apply_compiled(self, compiled: CompiledSpec, *, source: Any, dest: Any) -> Any:
+    def _cached_compile(self, spec: Any) -> Optional[CompiledSpec]:
+        """Return the cached :class:`CompiledSpec` for *spec*, compiling on a miss.
+
+        Entries are keyed by ``id(spec)`` and hold *spec* itself, so a hit is
+        only reported for the very same object (a recycled id never matches).
+        Returns ``None`` when the cache is disabled, the main pipeline has
+        middlewares, or *spec* cannot be compiled — the caller then interprets
+        it with ``Pipeline.run``.
+
+        The cache assumes specs are not mutated in place between calls; call
+        ``clear_compile_cache()`` after editing a spec or the main pipeline.
+        """
+        if self.compile_cache_size <= 0 or self.main_pipeline._middlewares:
+            return None
+        key = id(spec)
+        entry = self._compile_cache.get(key)
+        if entry is not None and entry[0] is spec:
+            self._compile_cache.move_to_end(key)
+            return entry[1]
+        try:
+            compiled = self.compile(spec)
+        except ValueError:
+            compiled = None  # let Pipeline.run report the error at the failing step
+        self._compile_cache[key] = (spec, compiled)
+        if len(self._compile_cache) > self.compile_cache_size:
+            self._compile_cache.popitem(last=False)
+        return compiled
+
+    def clear_compile_cache(self) -> None:
+        """Drop every spec compiled implicitly by ``apply`` / ``apply_async``."""
+        self._compile_cache.clear()
+
+    # -- result memoisation -------------------------------------------------
+
+    def _result_key(self, spec: Any, source: Any, dest: Any) -> Optional[Tuple[int, bytes]]:
+        """Return the memoisation key for an ``apply`` call, or ``None``.
+
+        The key pairs ``id(spec)`` with a digest of *spec*, *source* and
+        *dest*, so a spec edited in place misses; ``None`` means the cache is
+        disabled or an input is not plain JSON.  Building it serialises all
+        three documents, so every call pays that cost, hit or miss.
+
+        Registering a stage, action node or middleware on any registry since
+        the last call (even directly, bypassing the ``register_*`` methods
+        of this engine) clears the cache first.
+        """
+        if self.result_cache_size <= 0:
+            return None
+        if self._result_generation != _registry_generation:
+            self._result_cache.clear()
+            self._result_generation = _registry_generation
+        digest = _json_fingerprint(spec, source, dest)
+        return None if digest is None else (id(spec), digest)
+
+    def _cached_result(self, key: Tuple[int, bytes], spec: Any) -> Tuple[bool, Any]:
+        """Return ``(hit, result)``; a hit is only reported for the same spec object."""
+        entry = self._result_cache.get(key)
+        if entry is None or entry[0] is not spec:
+            return False, None
+        self._result_cache.move_to_end(key)
+        return True, _clone_json(entry[1])
+
+    def _store_result(self, key: Tuple[int, bytes], spec: Any, result: Any) -> None:
+        self._result_cache[key] = (spec, _clone_json(result))
+        if len(self._result_cache) > self.result_cache_size:
+            self._result_cache.popitem(last=False)
+
+    def clear_result_cache(self) -> None:
+        """Drop every result memoised by ``apply`` / ``apply_async``."""
+        self._result_cache.clear()
+
+    def apply_compiled(self, compiled: CompiledSpec, *, source: Any, dest: Any, copy_result: bool = True) -> Any:
         """Execute a :class:`CompiledSpec` with the given *source* and *dest*.
 
         Equivalent to :meth:`apply` but skips stage processing and matcher
         resolution (they were resolved at compile time).
 
         *source* is normalized (tuples → lists); *dest* is deep-copied.
-        Returns a deep copy of the final ``dest``.
+        Returns a deep copy of the final ``dest`` (see *copy_result* in
+        :meth:`apply`).
         """
         from .handlers.signals import ExitSignal
 
         ctx = ExecutionContext(
             source=_tuples_to_lists(source),
-            dest=copy.deepcopy(dest),
+            dest=_clone_json(dest),
             engine=self,
         )
         try:
@@ -1366,15 +1866,17 @@ class Engine:
                         _format_lang_stack(lang_stack),
                     )
             raise
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    async def apply_compiled_async(self, compiled: CompiledSpec, *, source: Any, dest: Any) -> Any:
+    async def apply_compiled_async(
+            self, compiled: CompiledSpec, *, source: Any, dest: Any, copy_result: bool = True,
+    ) -> Any:
         """Async version of :meth:`apply_compiled`."""
         from .handlers.signals import ExitSignal
 
         ctx = ExecutionContext(
             source=_tuples_to_lists(source),
-            dest=copy.deepcopy(dest),
+            dest=_clone_json(dest),
             engine=self,
         )
         try:
@@ -1392,30 +1894,35 @@ class Engine:
                         _format_lang_stack(lang_stack),
                     )
             raise
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    def apply_compiled_to_context(self, compiled: CompiledSpec, ctx: 'ExecutionContext') -> Any:
+    def apply_compiled_to_context(
+            self, compiled: CompiledSpec, ctx: 'ExecutionContext', *, copy_result: bool = True,
+    ) -> Any:
         """Like :meth:`apply_to_context`, but uses a :class:`CompiledSpec`.
 
         Runs ``main_pipeline.run_compiled(compiled, ctx)`` and returns a deep
-        copy of the resulting ``ctx.dest``.  The caller is responsible for
-        providing a properly initialised context.
+        copy of the resulting ``ctx.dest`` (``ctx.dest`` itself with
+        ``copy_result=False``).  The caller is responsible for providing a
+        properly initialised context.
 
         Like :meth:`apply_to_context`, this **propagates** a ``$exit``
         ``ExitSignal``; use :meth:`run_compiled_in_context` for an entry point
         that treats ``$exit`` as a clean finish.
         """
         self.main_pipeline.run_compiled(compiled, ctx)
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    async def apply_compiled_to_context_async(self, compiled: CompiledSpec, ctx: 'ExecutionContext') -> Any:
+    async def apply_compiled_to_context_async(
+            self, compiled: CompiledSpec, ctx: 'ExecutionContext', *, copy_result: bool = True,
+    ) -> Any:
         """Async version of :meth:`apply_compiled_to_context`.
 
         Also propagates ``$exit``; use :meth:`run_compiled_in_context_async` for
         an entry point that treats ``$exit`` as a clean finish.
         """
         await self.main_pipeline.run_compiled_async(compiled, ctx)
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
     def run_compiled_in_context(self, compiled: CompiledSpec, ctx: 'ExecutionContext') -> Any:
         """Run a compiled script in a caller-provided context (entry-point twin
@@ -1430,7 +1937,7 @@ class Engine:
         try:
             return self.apply_compiled_to_context(compiled, ctx)
         except ExitSignal:
-            return copy.deepcopy(ctx.dest)  # $exit — clean, error-free finish
+            return _clone_json(ctx.dest)  # $exit — clean, error-free finish
 
     async def run_compiled_in_context_async(self, compiled: CompiledSpec, ctx: 'ExecutionContext') -> Any:
         """Async version of :meth:`run_compiled_in_context`."""
@@ -1438,29 +1945,55 @@ class Engine:
         try:
             return await self.apply_compiled_to_context_async(compiled, ctx)
         except ExitSignal:
-            return copy.deepcopy(ctx.dest)  # $exit — clean, error-free finish
+            return _clone_json(ctx.dest)  # $exit — clean, error-free finish
 
     # -- public API ---------------------------------------------------------
 
-    def apply(self, spec: Any, *, source: Any, dest: Any) -> Any:
+    def apply(self, spec: Any, *, source: Any, dest: Any, copy_result: bool = True) -> Any:
         """Execute a DSL script through *main_pipeline*.
 
         *source* is normalized (tuples → lists for JMESPath compatibility).
         *dest* is deep-copied before processing; the return value is another
         deep copy so the caller's original is never touched.
 
+        ``copy_result=False`` skips that final copy and returns the engine's
+        working document itself.  It is safe when the caller will not mutate
+        the result, or owns everything it may alias (custom handlers that
+        store *source* or spec values without copying them).
+
+        With ``compile_cache_size > 0`` the spec is compiled on first use and
+        later calls with the same spec object reuse the :class:`CompiledSpec`,
+        skipping stage processing and handler resolution.  Engines whose main
+        pipeline has middlewares always take the interpreted path.
+
+        With ``result_cache_size > 0`` a call whose spec object, *source* and
+        *dest* were seen before returns a copy of the memoised result without
+        running the pipeline.  Only plain-JSON inputs are memoised, and only
+        specs without side effects (I/O, clocks, custom functions with state)
+        should be run on such an engine.
+
         On unhandled error, logs the language-level call stack at ``ERROR``
         level via the ``j_perm`` logger before re-raising.
         """
         from .handlers.signals import ExitSignal
 
+        key = self._result_key(spec, source, dest)
+        if key is not None:
+            hit, result = self._cached_result(key, spec)
+            if hit:
+                return result
+
         ctx = ExecutionContext(
             source=_tuples_to_lists(source),
-            dest=copy.deepcopy(dest),
+            dest=_clone_json(dest),
             engine=self,
         )
         try:
-            self.main_pipeline.run(spec, ctx)
+            compiled = self._cached_compile(spec)
+            if compiled is not None:
+                self.main_pipeline.run_compiled(compiled, ctx)
+            else:
+                self.main_pipeline.run(spec, ctx)
         except ExitSignal:
             pass  # $exit — clean, error-free early termination
         except Exception as e:
@@ -1474,26 +2007,39 @@ class Engine:
                         _format_lang_stack(lang_stack),
                     )
             raise
-        return copy.deepcopy(ctx.dest)
+        if key is not None:
+            self._store_result(key, spec, ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    async def apply_async(self, spec: Any, *, source: Any, dest: Any) -> Any:
+    async def apply_async(self, spec: Any, *, source: Any, dest: Any, copy_result: bool = True) -> Any:
         """Async version of apply().
 
         Execute a DSL script through *main_pipeline* asynchronously.
-        Supports async handlers, stages, and middlewares.
+        Supports async handlers, stages, and middlewares.  *copy_result*
+        behaves as in :meth:`apply`.
 
         On unhandled error, logs the language-level call stack at ``ERROR``
         level via the ``j_perm`` logger before re-raising.
         """
         from .handlers.signals import ExitSignal
 
+        key = self._result_key(spec, source, dest)
+        if key is not None:
+            hit, result = self._cached_result(key, spec)
+            if hit:
+                return result
+
         ctx = ExecutionContext(
             source=_tuples_to_lists(source),
-            dest=copy.deepcopy(dest),
+            dest=_clone_json(dest),
             engine=self,
         )
         try:
-            await self.main_pipeline.run_async(spec, ctx)
+            compiled = self._cached_compile(spec)
+            if compiled is not None:
+                await self.main_pipeline.run_compiled_async(compiled, ctx)
+            else:
+                await self.main_pipeline.run_async(spec, ctx)
         except ExitSignal:
             pass  # $exit — clean, error-free early termination
         except Exception as e:
@@ -1507,13 +2053,16 @@ class Engine:
                         _format_lang_stack(lang_stack),
                     )
             raise
-        return copy.deepcopy(ctx.dest)
+        if key is not None:
+            self._store_result(key, spec, ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    def apply_to_context(self, spec: Any, ctx: ExecutionContext) -> Any:
+    def apply_to_context(self, spec: Any, ctx: ExecutionContext, *, copy_result: bool = True) -> Any:
         """Like ``apply``, but takes a pre-constructed context and mutates it in-place.
 
         The caller is responsible for normalizing the source and deep-copying
-        the dest if necessary.  Returns a deep copy of ``ctx.dest``.
+        the dest if necessary.  Returns a deep copy of ``ctx.dest``, or
+        ``ctx.dest`` itself with ``copy_result=False``.
 
         This is also the internal runner for nested bodies, so it **propagates**
         a ``$exit`` ``ExitSignal`` rather than swallowing it.  If you use this as
@@ -1521,16 +2070,18 @@ class Engine:
         :meth:`run_script_in_context`, which does exactly that.
         """
         self.main_pipeline.run(spec, ctx)
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
-    async def apply_to_context_async(self, spec: Any, ctx: ExecutionContext) -> Any:
+    async def apply_to_context_async(
+            self, spec: Any, ctx: ExecutionContext, *, copy_result: bool = True,
+    ) -> Any:
         """Async version of apply_to_context().
 
         Also propagates ``$exit``; use :meth:`run_script_in_context_async` if you
         need an entry point that treats ``$exit`` as a clean finish.
         """
         await self.main_pipeline.run_async(spec, ctx)
-        return copy.deepcopy(ctx.dest)
+        return _clone_json(ctx.dest) if copy_result else ctx.dest
 
     def run_script_in_context(self, spec: Any, ctx: ExecutionContext) -> Any:
         """Run a whole script in a caller-provided context (entry-point twin of
@@ -1555,7 +2106,7 @@ class Engine:
         try:
             return self.apply_to_context(spec, ctx)
         except ExitSignal:
-            return copy.deepcopy(ctx.dest)  # $exit — clean, error-free finish
+            return _clone_json(ctx.dest)  # $exit — clean, error-free finish
 
     async def run_script_in_context_async(self, spec: Any, ctx: ExecutionContext) -> Any:
         """Async version of :meth:`run_script_in_context`."""
@@ -1563,7 +2114,7 @@ class Engine:
         try:
             return await self.apply_to_context_async(spec, ctx)
         except ExitSignal:
-            return copy.deepcopy(ctx.dest)  # $exit — clean, error-free finish
+            return _clone_json(ctx.dest)  # $exit — clean, error-free finish
 
     def run_pipeline(self, name: str, spec: Any, ctx: ExecutionContext) -> ExecutionContext:
         """Run a named pipeline over the given context, as-is.
@@ -1643,6 +2194,25 @@ class Engine:
             raise
         return ctx
 
+    def _probe_scalar(self, value: Any) -> Optional[List[Any]]:
+        """Resolve scalar *value* against *value_pipeline* up front.
+
+        Returns its handler list when the pipeline has no stages or
+        middlewares (so dispatch depends on *value* alone), else ``None``.
+        Containers are never probed — the container handler descends them.
+        The caller either returns early (see ``_passes_through``) or hands
+        the list to the first ``Pipeline.run`` so it is not resolved twice.
+        """
+        pipeline = self.value_pipeline
+        if type(value) not in _JSON_ATOMS or pipeline._middlewares or pipeline.stages._nodes:
+            return None
+        return pipeline.registry.resolve(value)
+
+    @staticmethod
+    def _passes_through(handlers: Optional[List[Any]]) -> bool:
+        """``True`` if probed *handlers* are all ``passthrough`` (the identity fallback)."""
+        return bool(handlers) and all(getattr(h, 'passthrough', False) for h in handlers)
+
     def process_value(self, value: Any, ctx: ExecutionContext, *, _unescape: bool = True) -> Any:
         """Run *value_pipeline* over *value* until it stabilises.
 
@@ -1656,30 +2226,45 @@ class Engine:
         ``RecursiveDescentHandler`` so that unescaping happens only once at
         the outermost invocation.
 
+        Scalars that only the identity fallback would handle (plain strings,
+        numbers, ``None``…) skip the loop entirely — see ``_passes_through``;
+        other scalars reuse the probe's handlers on the first iteration.
+
         If *value_pipeline* is ``None``, returns *value* unchanged.
         """
         if self.value_pipeline is None:
             return value
+        probed = self._probe_scalar(value)
+        if self._passes_through(probed):
+            if _unescape:
+                for unescape in self._unescape_passes:
+                    value = unescape(value)
+            return value
 
         trace = _log_values.isEnabledFor(logging.DEBUG)
         repr_max = self.trace_repr_max
         indent = "  " * len(ctx.metadata.get(_LANG_EXEC_STACK_KEY, []))
 
+        # Save real dest in metadata for JMESPath access
+        # Preserve existing _real_dest if we're in a nested process_value call
+        real_dest = ctx.metadata.get('_real_dest', ctx.dest)
+
         current = value
         for _ in range(self.value_max_depth):
-            # Save real dest in metadata for JMESPath access
-            # Preserve existing _real_dest if we're in a nested process_value call
-            metadata_with_dest = {**ctx.metadata, '_real_dest': ctx.metadata.get('_real_dest', ctx.dest)}
-            value_ctx = ctx.copy(
-                new_dest=current,
-                new_metadata=metadata_with_dest,
+            value_ctx = ExecutionContext(
+                ctx.source, current, ctx.engine,
+                {**ctx.metadata, '_real_dest': real_dest},
+                ctx.temp_read_only, ctx.temp,
             )
             try:
-                self.value_pipeline.run([current], value_ctx)
+                self.value_pipeline.run([current], value_ctx, _bound=[probed] if probed else None)
+                probed = None
             except PipelineSignal:
                 current = value_ctx.dest
                 break
-            if value_ctx.dest == current:
+            # Identity first: a no-op pass usually hands back the very same
+            # object, and ``==`` on a large container would walk all of it.
+            if value_ctx.dest is current or value_ctx.dest == current:
                 break
             if trace:
                 _log_values.debug(
@@ -1693,8 +2278,8 @@ class Engine:
             raise RecursionError("value_max_depth exceeded")
 
         if _unescape:
-            for rule in self._unescape_rules:
-                current = rule.unescape(current)
+            for unescape in self._unescape_passes:
+                current = unescape(current)
         return current
 
     async def process_value_async(self, value: Any, ctx: ExecutionContext, *, _unescape: bool = True) -> Any:
@@ -1705,26 +2290,37 @@ class Engine:
         """
         if self.value_pipeline is None:
             return value
+        probed = self._probe_scalar(value)
+        if self._passes_through(probed):
+            if _unescape:
+                for unescape in self._unescape_passes:
+                    value = unescape(value)
+            return value
 
         trace = _log_values.isEnabledFor(logging.DEBUG)
         repr_max = self.trace_repr_max
         indent = "  " * len(ctx.metadata.get(_LANG_EXEC_STACK_KEY, []))
 
+        # Save real dest in metadata for JMESPath access
+        # Preserve existing _real_dest if we're in a nested process_value call
+        real_dest = ctx.metadata.get('_real_dest', ctx.dest)
+
         current = value
         for _ in range(self.value_max_depth):
-            # Save real dest in metadata for JMESPath access
-            # Preserve existing _real_dest if we're in a nested process_value call
-            metadata_with_dest = {**ctx.metadata, '_real_dest': ctx.metadata.get('_real_dest', ctx.dest)}
-            value_ctx = ctx.copy(
-                new_dest=current,
-                new_metadata=metadata_with_dest,
+            value_ctx = ExecutionContext(
+                ctx.source, current, ctx.engine,
+                {**ctx.metadata, '_real_dest': real_dest},
+                ctx.temp_read_only, ctx.temp,
             )
             try:
-                await self.value_pipeline.run_async([current], value_ctx)
+                await self.value_pipeline.run_async([current], value_ctx, _bound=[probed] if probed else None)
+                probed = None
             except PipelineSignal:
                 current = value_ctx.dest
                 break
-            if value_ctx.dest == current:
+            # Identity first: a no-op pass usually hands back the very same
+            # object, and ``==`` on a large container would walk all of it.
+            if value_ctx.dest is current or value_ctx.dest == current:
                 break
             if trace:
                 _log_values.debug(
@@ -1738,6 +2334,6 @@ class Engine:
             raise RecursionError("value_max_depth exceeded")
 
         if _unescape:
-            for rule in self._unescape_rules:
-                current = rule.unescape(current)
+            for unescape in self._unescape_passes:
+                current = unescape(current)
         return current
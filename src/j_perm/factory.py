@@ -68,7 +68,7 @@ from .handlers.ops_async import (
 )
 from .handlers.special import SpecialFn, SpecialMatcher, SpecialResolveHandler
 from .handlers.special_async import AsyncSpecialResolveHandler
-from .handlers.template import TemplMatcher, TemplSubstHandler, template_unescape
+from .handlers.template import TemplMatcher, TemplSubstHandler, template_unescape, template_unescape_str
 from .matchers import AlwaysMatcher, OpMatcher
 from j_perm.processors.pointer_processor import PointerProcessor
 from .resolvers.pointer import PointerResolver
@@ -282,6 +282,8 @@ def _make_engine(
         map_filter_max_items: int,
         trace_logging: bool,
         trace_repr_max: int | None,
+        compile_cache_size: int,
+        result_cache_size: int,
         text_syntax: bool,
         constructs_module: Any,
         special_handler_cls: Any,
@@ -328,7 +330,7 @@ def _make_engine(
     main_pipeline = Pipeline(stages=main_stages, registry=main_reg, track_execution=True)
 
     unescape_rules = [
-        UnescapeRule(name="template", priority=0, unescape=template_unescape),
+        UnescapeRule(name="template", priority=0, unescape=template_unescape, leaf=template_unescape_str),
     ]
 
     engine = Engine(
@@ -342,6 +344,8 @@ def _make_engine(
         max_function_recursion_depth=max_function_recursion_depth,
         trace_logging=trace_logging,
         trace_repr_max=trace_repr_max,
+        compile_cache_size=compile_cache_size,
+        result_cache_size=result_cache_size,
     )
 
     if text_syntax:
@@ -383,6 +387,10 @@ def build_default_engine(
         # Logging / tracing
         trace_logging: bool = False,
         trace_repr_max: int | None = 200,
+        # Compiled-spec reuse for repeated apply() calls
+        compile_cache_size: int = 0,
+        # Result memoisation for side-effect-free specs
+        result_cache_size: int = 0,
         # Text syntax
         text_syntax: bool = True,
 ) -> Engine:
@@ -438,6 +446,8 @@ def build_default_engine(
         sub_max_number_result=sub_max_number_result,
         map_filter_max_items=map_filter_max_items,
         trace_logging=trace_logging, trace_repr_max=trace_repr_max,
+        compile_cache_size=compile_cache_size,
+        result_cache_size=result_cache_size,
         text_syntax=text_syntax,
         constructs_module=_constructs,
         special_handler_cls=SpecialResolveHandler,
@@ -472,6 +482,8 @@ def build_default_async_engine(
         sub_max_number_result: float = 1e15,
         trace_logging: bool = False,
         trace_repr_max: int | None = 200,
+        compile_cache_size: int = 0,
+        result_cache_size: int = 0,
         text_syntax: bool = True,
 ) -> Engine:
     """Assemble the async twin of :func:`build_default_engine`.
@@ -535,6 +547,8 @@ def build_default_async_engine(
         sub_max_number_result=sub_max_number_result,
         map_filter_max_items=map_filter_max_items,
         trace_logging=trace_logging, trace_repr_max=trace_repr_max,
+        compile_cache_size=compile_cache_size,
+        result_cache_size=result_cache_size,
         text_syntax=text_syntax,
         constructs_module=_constructs_async,
         special_handler_cls=AsyncSpecialResolveHandler,
@@ -67,13 +67,14 @@ from .ops import (
     HashHandler,
 )
 from .special import SpecialFn, SpecialMatcher, SpecialResolveHandler
-from .template import TemplMatcher, TemplSubstHandler, template_unescape
+from .template import TemplMatcher, TemplSubstHandler, template_unescape, template_unescape_str
 
 __all__ = [
     # template
     "TemplMatcher",
     "TemplSubstHandler",
     "template_unescape",
+    "template_unescape_str",
     # special
     "SpecialFn",
     "SpecialMatcher",
@@ -29,6 +29,7 @@ from __future__ import annotations
 import copy
 import math
 import re
+from functools import lru_cache
 from typing import Any, Mapping, Callable
 
 import regex
@@ -358,12 +359,22 @@ def _validate_regex_flags(key: str, flags: int, resolved_flags: int) -> None:
         )
 
 
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str, flags: int) -> regex.Pattern:
+    """Compile *pattern* once per ``(pattern, flags)``, shared by all regex handlers.
+
+    Skips the argument checks and cache probe that the ``regex.search`` family
+    repeats on every call.
+    """
+    return regex.compile(pattern, flags)
+
+
 def _regex_match_compute(key, pattern, string, flags, resolved_flags, timeout):
     if not isinstance(string, str):
         raise ValueError(f"{key} 'string' must be a string, got {type(string).__name__}")
     _validate_regex_flags(key, flags, resolved_flags)
     try:
-        return bool(regex.fullmatch(pattern, string, flags, timeout=timeout))
+        return bool(_compile_regex(pattern, flags).fullmatch(string, timeout=timeout))
     except TimeoutError:
         raise TimeoutError(f"Regex operation exceeded timeout of {timeout}s")
 
@@ -373,7 +384,7 @@ def _regex_search_compute(key, pattern, string, flags, resolved_flags, timeout):
         raise ValueError(f"{key} 'string' must be a string, got {type(string).__name__}")
     _validate_regex_flags(key, flags, resolved_flags)
     try:
-        match = regex.search(pattern, string, flags, timeout=timeout)
+        match = _compile_regex(pattern, flags).search(string, timeout=timeout)
         return match.group(0) if match else None
     except TimeoutError:
         raise TimeoutError(f"Regex operation exceeded timeout of {timeout}s")
@@ -384,7 +395,7 @@ def _regex_findall_compute(key, pattern, string, flags, resolved_flags, timeout)
         raise ValueError(f"{key} 'string' must be a string, got {type(string).__name__}")
     _validate_regex_flags(key, flags, resolved_flags)
     try:
-        return regex.findall(pattern, string, flags, timeout=timeout)
+        return _compile_regex(pattern, flags).findall(string, timeout=timeout)
     except TimeoutError:
         raise TimeoutError(f"Regex operation exceeded timeout of {timeout}s")
 
@@ -394,7 +405,7 @@ def _regex_groups_compute(key, pattern, string, flags, resolved_flags, timeout,
         raise ValueError(f"{key} 'string' must be a string, got {type(string).__name__}")
     _validate_regex_flags(key, flags, resolved_flags)
     try:
-        match = regex.search(pattern, string, flags, timeout=timeout)
+        match = _compile_regex(pattern, flags).search(string, timeout=timeout)
     except TimeoutError:
         raise TimeoutError(f"Regex operation exceeded timeout of {timeout}s")
     if named:
@@ -407,7 +418,7 @@ def _regex_replace_compute(pattern, replacement, string, count, flags, resolved_
         raise ValueError(f"$regex_replace 'string' must be a string, got {type(string).__name__}")
     _validate_regex_flags("$regex_replace", flags, resolved_flags)
     try:
-        return regex.sub(pattern, replacement, string, count, flags, timeout=timeout)
+        return _compile_regex(pattern, flags).sub(replacement, string, count, timeout=timeout)
     except TimeoutError:
         raise TimeoutError(f"Regex operation exceeded timeout of {timeout}s")
 
@@ -15,5 +15,7 @@ class IdentityHandler(ActionHandler):
     produces a result without raising.
     """
 
+    passthrough = True
+
     def execute(self, step: Any, ctx: ExecutionContext) -> Any:
         return step
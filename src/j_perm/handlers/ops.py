@@ -27,7 +27,7 @@ from urllib.parse import quote as _url_quote, unquote as _url_unquote
 
 import yaml as _yaml
 
-from ..core import ActionHandler, Compound, CompiledSpec, ExecutionContext
+from ..core import ActionHandler, Compound, CompiledSpec, ExecutionContext, _clone_json
 from .merge import deep_update
 from .signals import BreakSignal, ContinueSignal, ReturnSignal, ExitSignal
 
@@ -280,7 +280,7 @@ class ForeachHandler(ActionHandler, Compound):
 
         var = ctx.engine.process_value(step.get("as", "item"), ctx)
         body = step["do"]
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
 
         try:
             for elem in arr:
@@ -358,8 +358,10 @@ class WhileHandler(ActionHandler, Compound):
                 current = None
                 missing = True
             if "equals" in step:
+                if missing:
+                    return False
                 expected = ctx.engine.process_value(step["equals"], ctx)
-                return current == expected and not missing
+                return current == expected
             elif ctx.engine.process_value(step.get("exists", False), ctx):
                 return not missing
             else:
@@ -375,7 +377,7 @@ class WhileHandler(ActionHandler, Compound):
     def _run(self, step: Any, ctx: ExecutionContext, compiled_body: Any) -> Any:
         do_while = bool(ctx.engine.process_value(step.get("do_while", False), ctx))
         body = step["do"]
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
 
         try:
             iteration = 0
@@ -448,8 +450,10 @@ class IfHandler(ActionHandler, Compound):
                 current = None
                 missing = True
             if "equals" in step:
+                if missing:
+                    return False
                 expected = ctx.engine.process_value(step["equals"], ctx)
-                return current == expected and not missing
+                return current == expected
             elif ctx.engine.process_value(step.get("exists", False), ctx):
                 return not missing
             else:
@@ -476,11 +480,15 @@ class IfHandler(ActionHandler, Compound):
             return ctx.dest
 
         compiled_branch = nested.get(branch_key) if (nested and branch_key) else None
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
         try:
+            # Run the branch on the live context: unlike apply_to_context, no
+            # copy of dest is made — the snapshot above covers rollback.
             if compiled_branch is not None:
-                return compiled_branch.run(ctx)
-            return ctx.engine.apply_to_context(actions, ctx)
+                compiled_branch.run_in_place(ctx)
+            else:
+                ctx.engine.main_pipeline.run(actions, ctx)
+            return ctx.dest
         except (BreakSignal, ContinueSignal, ReturnSignal, ExitSignal):
             raise  # Don't rollback — propagate control flow signals as-is
         except Exception:
@@ -24,7 +24,7 @@ import asyncio
 import copy
 from typing import Any
 
-from ..core import AsyncActionHandler, CompiledSpec, ExecutionContext
+from ..core import AsyncActionHandler, CompiledSpec, ExecutionContext, _clone_json
 from .merge import deep_merge
 from .ops import (
     SetHandler, CopyHandler, DeleteHandler,
@@ -132,7 +132,7 @@ class AsyncForeachHandler(ForeachHandler, AsyncActionHandler):
         if bool(await ctx.engine.process_value_async(step.get("parallel", False), ctx)):
             return await self._arun_parallel(step, ctx, compiled_body, arr, var, body)
 
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
         try:
             for elem in arr:
                 foreach_ctx = ctx.copy(new_temp_read_only={**ctx.temp_read_only, var: elem})
@@ -182,7 +182,7 @@ class AsyncForeachHandler(ForeachHandler, AsyncActionHandler):
             async with sem:
                 return await run_one(elem)
 
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
         try:
             results = await asyncio.gather(*(guarded(elem) for elem in arr))
         except (BreakSignal, ContinueSignal) as exc:
@@ -220,8 +220,10 @@ class AsyncWhileHandler(WhileHandler, AsyncActionHandler):
                 current = None
                 missing = True
             if "equals" in step:
+                if missing:
+                    return False
                 expected = await ctx.engine.process_value_async(step["equals"], ctx)
-                return current == expected and not missing
+                return current == expected
             elif await ctx.engine.process_value_async(step.get("exists", False), ctx):
                 return not missing
             else:
@@ -238,7 +240,7 @@ class AsyncWhileHandler(WhileHandler, AsyncActionHandler):
     async def _arun(self, step: Any, ctx: ExecutionContext, compiled_body: Any) -> Any:
         do_while = bool(await ctx.engine.process_value_async(step.get("do_while", False), ctx))
         body = step["do"]
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
 
         try:
             iteration = 0
@@ -288,8 +290,10 @@ class AsyncIfHandler(IfHandler, AsyncActionHandler):
                 current = None
                 missing = True
             if "equals" in step:
+                if missing:
+                    return False
                 expected = await ctx.engine.process_value_async(step["equals"], ctx)
-                return current == expected and not missing
+                return current == expected
             elif await ctx.engine.process_value_async(step.get("exists", False), ctx):
                 return not missing
             else:
@@ -313,11 +317,15 @@ class AsyncIfHandler(IfHandler, AsyncActionHandler):
             return ctx.dest
 
         compiled_branch = nested.get(branch_key) if (nested and branch_key) else None
-        snapshot = copy.deepcopy(ctx.dest)
+        snapshot = _clone_json(ctx.dest)
         try:
+            # Run the branch on the live context: unlike apply_to_context_async,
+            # no copy of dest is made — the snapshot above covers rollback.
             if compiled_branch is not None:
-                return await compiled_branch.run_async(ctx)
-            return await ctx.engine.apply_to_context_async(actions, ctx)
+                await compiled_branch.run_in_place_async(ctx)
+            else:
+                await ctx.engine.main_pipeline.run_async(actions, ctx)
+            return ctx.dest
         except (BreakSignal, ContinueSignal, ReturnSignal, ExitSignal):
             raise
         except Exception:
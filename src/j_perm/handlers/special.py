@@ -62,13 +62,28 @@ class SpecialResolveHandler(ActionHandler):
 
     def __init__(self, specials: Mapping[str, SpecialFn] | None = None) -> None:
         self._specials: dict[str, SpecialFn] = dict(specials) if specials else {}
+        # key → (registration index, handler); a step has a handful of keys
+        # while the registry has dozens, so dispatch scans the step instead.
+        self._ranked: dict[str, tuple[int, SpecialFn]] = {
+            key: (i, fn) for i, (key, fn) in enumerate(self._specials.items())
+        }
+
+    def _lookup(self, step: Any) -> SpecialFn | None:
+        """Return the handler of the earliest-registered key in *step*."""
+        ranked = self._ranked
+        best = None
+        for key in step:
+            entry = ranked.get(key)
+            if entry is not None and (best is None or entry[0] < best[0]):
+                best = entry
+        return None if best is None else best[1]
 
     def execute(self, step: Any, ctx: ExecutionContext) -> Any:
-        for key, fn in self._specials.items():
-            if key in step:
-                result = fn(step, ctx)
-                if step.get("$raw") is True:
-                    from .signals import RawValueSignal
-                    raise RawValueSignal(result)
-                return result
-        return step
+        fn = self._lookup(step)
+        if fn is None:
+            return step
+        result = fn(step, ctx)
+        if step.get("$raw") is True:
+            from .signals import RawValueSignal
+            raise RawValueSignal(result)
+        return result
@@ -20,12 +20,12 @@ class AsyncSpecialResolveHandler(SpecialResolveHandler, AsyncActionHandler):
     """Async special-construct dispatch."""
 
     async def execute(self, step: Any, ctx: ExecutionContext) -> Any:
-        for key, fn in self._specials.items():
-            if key in step:
-                result = fn(step, ctx)
-                if inspect.isawaitable(result):
-                    result = await result
-                if step.get("$raw") is True:
-                    raise RawValueSignal(result)
-                return result
-        return step
+        fn = self._lookup(step)
+        if fn is None:
+            return step
+        result = fn(step, ctx)
+        if inspect.isawaitable(result):
+            result = await result
+        if step.get("$raw") is True:
+            raise RawValueSignal(result)
+        return result
@@ -40,7 +40,8 @@ Example: ``${?add(dest.total, source.order.total)}``
 from __future__ import annotations
 
 import json
-from typing import Any, Callable, Mapping
+from functools import lru_cache
+from typing import Any, Callable, List, Mapping, Tuple
 
 import jmespath
 from jmespath import functions as _jp_funcs
@@ -90,6 +91,76 @@ def _has_unescaped_placeholder(s: str) -> bool:
         return True
 
 
+# Template strings come from the spec and repeat on every apply / iteration,
+# so their split form is memoised.  Only short strings are: long ones are
+# mostly values pulled from source data, which the process-wide cache would
+# otherwise keep alive across engines.
+_SPLIT_CACHE_MAX_LEN = 256
+
+
+def _split_template(tmpl: str) -> Tuple[Tuple[bool, str], ...]:
+    """Return the segments of *tmpl* (see :func:`_parse_template`), memoised
+    for templates of at most ``_SPLIT_CACHE_MAX_LEN`` characters.
+    """
+    if len(tmpl) <= _SPLIT_CACHE_MAX_LEN:
+        return _parse_template_cached(tmpl)
+    return _parse_template(tmpl)
+
+
+def _parse_template(tmpl: str) -> Tuple[Tuple[bool, str], ...]:
+    """Split *tmpl* into ``(is_expr, text)`` segments with brace-depth tracking.
+
+    Literal runs are merged; ``$${`` / ``$$`` escapes stay in the literal text
+    verbatim, and an unclosed ``${`` is treated as literal.
+    """
+    parts: List[Tuple[bool, str]] = []
+    lit: List[str] = []
+    i = 0
+
+    while i < len(tmpl):
+        if tmpl[i:i + 3] == "$${":  # escaped $${  – keep literal
+            lit.append("$${")
+            i += 3
+            continue
+        if tmpl[i:i + 2] == "$$":  # escaped $$   – keep literal
+            lit.append("$$")
+            i += 2
+            continue
+
+        if tmpl[i:i + 2] == "${":
+            depth = 0
+            j = i + 2
+
+            while j < len(tmpl):
+                ch = tmpl[j]
+                if ch == "{" and tmpl[j - 1] == "$":
+                    depth += 1
+                elif ch == "}":
+                    if depth == 0:
+                        if lit:
+                            parts.append((False, "".join(lit)))
+                            lit = []
+                        parts.append((True, tmpl[i + 2:j]))
+                        i = j + 1
+                        break
+                    depth -= 1
+                j += 1
+            else:
+                # unclosed brace – emit ``$`` as literal, retry from ``{``
+                lit.append(tmpl[i])
+                i += 1
+        else:
+            lit.append(tmpl[i])
+            i += 1
+
+    if lit:
+        parts.append((False, "".join(lit)))
+    return tuple(parts)
+
+
+_parse_template_cached = lru_cache(maxsize=4096)(_parse_template)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Matcher
 # ─────────────────────────────────────────────────────────────────────────────
@@ -139,6 +210,7 @@ class TemplSubstHandler(ActionHandler):
             jmes_options: jmespath.Options | None = None,
     ) -> None:
         self._casters = dict(casters) if casters else BUILTIN_CASTERS
+        self._caster_tags = tuple((f"{prefix}:", fn) for prefix, fn in self._casters.items())
         self._jp_options = jmes_options if jmes_options else _BUILTIN_JMES_OPTIONS
 
     # -- public -------------------------------------------------------------
@@ -147,97 +219,43 @@ class TemplSubstHandler(ActionHandler):
         if not isinstance(step, str):
             return step
 
+        parts = _split_template(step)
+
         # If entire string is one template expression, return native type
-        if self._is_single_expression(step):
-            expr = step[2:-1]  # Strip ${ and }
-            return self._resolve_expr(expr, ctx)
+        if len(parts) == 1 and parts[0][0]:
+            return self._resolve_expr(parts[0][1], ctx)
 
-        return self._flat_substitute(step, ctx)
+        return self._render(parts, ctx)
 
     # -- internal -----------------------------------------------------------
 
-    def _is_single_expression(self, s: str) -> bool:
-        """Check if string is exactly '${...}' with no surrounding text."""
-        if not (s.startswith("${") and s.endswith("}")):
-            return False
-
-        # Find the matching closing brace
-        depth = 0
-        for i in range(2, len(s)):
-            if i > 0 and s[i - 1 : i + 1] == "${":
-                depth += 1
-            elif s[i] == "}":
-                if depth == 0:
-                    # Found matching close at position i
-                    # Check if it's the last character
-                    return i == len(s) - 1
-                else:
-                    depth -= 1
-
-        return False
-
     def _flat_substitute(self, tmpl: str, ctx: ExecutionContext) -> Any:
-        """Single-pass expansion with brace-depth tracking.
+        """Single-pass expansion of every placeholder in *tmpl*.
 
         Always returns a *string*.  Type coercion is the caller's job.
         """
-        out: list[str] = []
-        i = 0
+        return self._render(_split_template(tmpl), ctx)
 
-        while i < len(tmpl):
-            if tmpl[i:i + 3] == "$${":  # escaped $${  – keep literal
-                out.append("$${")
-                i += 3
-                continue
-            if tmpl[i:i + 2] == "$$":  # escaped $$   – keep literal
-                out.append("$$")
-                i += 2
+    def _render(self, parts: Tuple[Tuple[bool, str], ...], ctx: ExecutionContext) -> str:
+        """Join literal segments with the rendered value of each placeholder."""
+        out: list[str] = []
+        for is_expr, text in parts:
+            if not is_expr:
+                out.append(text)
                 continue
-
-            if tmpl[i:i + 2] == "${":
-                depth = 0
-                j = i + 2
-
-                while j < len(tmpl):
-                    ch = tmpl[j]
-                    if ch == "{" and tmpl[j - 1] == "$":
-                        depth += 1
-                    elif ch == "}":
-                        if depth == 0:
-                            expr = tmpl[i + 2:j]
-                            val = self._resolve_expr(expr, ctx)
-
-                            if isinstance(val, (Mapping, list)):
-                                rendered = json.dumps(val, ensure_ascii=False)
-                            else:
-                                rendered = str(val)
-
-                            out.append(rendered)
-                            i = j + 1
-                            break
-                        depth -= 1
-                    j += 1
-                else:
-                    # unclosed brace – emit ``$`` as literal, retry from ``{``
-                    out.append(tmpl[i])
-                    i += 1
+            val = self._resolve_expr(text, ctx)
+            if isinstance(val, (Mapping, list)):
+                out.append(json.dumps(val, ensure_ascii=False))
             else:
-                out.append(tmpl[i])
-                i += 1
-
+                out.append(str(val))
         return "".join(out)
 
     def _resolve_expr(self, expr: str, ctx: ExecutionContext) -> Any:
         """Dispatch a single extracted expression."""
         expr = expr.strip()
-        # Build JMESPath data with explicit source/dest namespaces
-        # In value pipeline, dest is the current value, real dest is in metadata
-        real_dest = ctx.metadata.get('_real_dest', ctx.dest)
-        data = {"source": ctx.source, "dest": real_dest, "temp": ctx.temp, "args": ctx.temp_read_only}
 
         # 1) Casters
-        for prefix, fn in self._casters.items():
-            tag = f"{prefix}:"
+        for tag, fn in self._caster_tags:
             if expr.startswith(tag):
                 inner = expr[len(tag):]
                 # Recursively resolve the inner expression (may be pointer, template, etc.)
@@ -248,6 +266,10 @@ class TemplSubstHandler(ActionHandler):
         if expr.startswith("?"):
             query_raw = expr[1:].lstrip()
             query_expanded = self._flat_substitute(query_raw, ctx)
+            # Build JMESPath data with explicit source/dest namespaces
+            # In value pipeline, dest is the current value, real dest is in metadata
+            real_dest = ctx.metadata.get('_real_dest', ctx.dest)
+            data = {"source": ctx.source, "dest": real_dest, "temp": ctx.temp, "args": ctx.temp_read_only}
             return jmespath.search(query_expanded, data, options=self._jp_options)
 
         # 3) Nested template
@@ -268,6 +290,11 @@ class TemplSubstHandler(ActionHandler):
 # ─────────────────────────────────────────────────────────────────────────────
 
 
+def template_unescape_str(text: str) -> str:
+    """Strip the template escape layer from a single string (``$${`` → ``${``, ``$$`` → ``$``)."""
+    return text.replace("$${", "${").replace("$$", "$")
+
+
 def template_unescape(obj: Any) -> Any:
     """Recursively strip the template escape layer: ``$${`` → ``${``, ``$$`` → ``$``.
 
@@ -278,7 +305,7 @@ def template_unescape(obj: Any) -> Any:
     ``TemplSubstHandler`` preserves during substitution.
     """
     if isinstance(obj, str):
-        return obj.replace("$${", "${").replace("$$", "$")
+        return template_unescape_str(obj)
     if isinstance(obj, list):
         return [template_unescape(x) for x in obj]
     if isinstance(obj, tuple):
@@ -33,6 +33,10 @@ class OpMatcher(ActionMatcher):
 
     def __init__(self, op: str) -> None:
         self._op = op
+        # A subclass that overrides ``matches`` may accept other steps as
+        # well, so it keeps the op-keyed fast path only by setting op_key.
+        if type(self).matches is OpMatcher.matches:
+            self.op_key = op
 
     def matches(self, step: Any) -> bool:
         return isinstance(step, Mapping) and step.get("op") == self._op
@@ -13,10 +13,84 @@ Self-contained implementation with full support for:
 from __future__ import annotations
 
 import re
-from typing import Any, List, Tuple
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
 
 from ..core import ValueResolver
 
+_SLICE_RE = re.compile(r"(.+)\[(-?\d*):(-?\d*)]$")
+
+
+def _decode_token(tok: str) -> str:
+    """Decode a single JSON Pointer token (RFC6901 + custom escapes)."""
+    return (
+        tok.replace("~0", "~")
+        .replace("~1", "/")
+        .replace("~2", "$")
+        .replace("~3", ".")
+    )
+
+
+def _as_index(tok: str) -> Optional[int]:
+    """Return ``int(tok)`` when *tok* can index a list, else ``None``."""
+    try:
+        return int(tok)
+    except ValueError:
+        return None
+
+
+# A parsed token is ``(key, index)``: the decoded key plus its pre-converted
+# list index (``None`` when the key is not numeric), so walkers never re-run
+# ``int()`` on a repeated pointer.
+_Token = Tuple[str, Optional[int]]
+
+# Pointer strings in a script are few and repeat on every step/iteration, so
+# their parsed forms are memoised; the bound keeps dynamic pointers in check.
+
+@lru_cache(maxsize=4096)
+def _parse_pointer(ptr: str) -> Tuple[Tuple[Optional[_Token], ...], bool]:
+    """Split *ptr* into tokens; a ``..`` segment becomes ``None``.
+
+    The flag is ``True`` when at least one ``..`` segment is present.
+    """
+    tokens: List[Optional[_Token]] = []
+    for raw in ptr.lstrip("/").split("/"):
+        if raw == "..":
+            tokens.append(None)
+        else:
+            tok = _decode_token(raw)
+            tokens.append((tok, _as_index(tok)))
+    return tuple(tokens), None in tokens
+
+
+@lru_cache(maxsize=4096)
+def _parse_parent_path(ptr: str) -> Tuple[Tuple[_Token, ...], str]:
+    """Return ``(intermediate_tokens, leaf)`` with ``..`` segments collapsed.
+
+    An empty path yields ``((), "")``.
+    """
+    parts: List[str] = []
+    for raw in ptr.lstrip("/").split("/"):
+        if raw == "..":
+            if parts:
+                parts.pop()
+            continue
+        parts.append(raw)
+    if not parts:
+        return (), ""
+    decoded = [_decode_token(raw) for raw in parts]
+    return tuple((tok, _as_index(tok)) for tok in decoded[:-1]), decoded[-1]
+
+
+@lru_cache(maxsize=4096)
+def _parse_slice(ptr: str) -> Optional[Tuple[str, Optional[int], Optional[int]]]:
+    """Return ``(base, start, end)`` for a ``ptr[start:end]`` suffix, else ``None``."""
+    m = _SLICE_RE.match(ptr)
+    if not m:
+        return None
+    base, s, e = m.groups()
+    return base, int(s) if s else None, int(e) if e else None
+
 
 class PointerResolver(ValueResolver):
     """Self-contained ``ValueResolver`` with JSON Pointer semantics.
@@ -27,8 +101,6 @@ class PointerResolver(ValueResolver):
     - Fully inlined and optimized for the new architecture
     """
 
-    _SLICE_RE = re.compile(r"(.+)\[(-?\d*):(-?\d*)]$")
-
     # -- read ---------------------------------------------------------------
 
     def get(self, path: str, data: Any) -> Any:
@@ -44,6 +116,35 @@ class PointerResolver(ValueResolver):
         """
         return self._maybe_slice(path, data)
 
+    def exists(self, path: str, data: Any) -> bool:
+        """Check whether *path* resolves, without raising on the common miss.
+
+        Plain pointers over ``dict`` / ``list`` / ``tuple`` are walked with
+        membership and bounds tests; slices, ``..`` segments and any other
+        container fall back to the ``get``-based default.
+        """
+        if path in ("", "/", "."):
+            return True
+        if _parse_slice(path) is None:
+            tokens, climbs = _parse_pointer(path)
+            if not climbs:
+                cur = data
+                for key, idx in tokens:
+                    cls = type(cur)
+                    if cls is dict:
+                        if key not in cur:
+                            return False
+                        cur = cur[key]
+                    elif (cls is list or cls is tuple) and idx is not None:
+                        if not -len(cur) <= idx < len(cur):
+                            return False
+                        cur = cur[idx]
+                    else:
+                        break
+                else:
+                    return True
+        return super().exists(path, data)
+
     def set(self, path: str, data: Any, value: Any) -> Any:
         """Write *value* at *path*.
 
@@ -93,36 +194,35 @@ class PointerResolver(ValueResolver):
 
     # -- internal helpers ---------------------------------------------------
 
-    def _decode(self, tok: str) -> str:
-        """Decode a single JSON Pointer token (RFC6901 + custom escapes)."""
-        return (
-            tok.replace("~0", "~")
-            .replace("~1", "/")
-            .replace("~2", "$")
-            .replace("~3", ".")
-        )
-
     def _get_pointer(self, doc: Any, ptr: str) -> Any:
         """Read value by JSON Pointer, supporting root and '..' segments."""
         if ptr in ("", "/", "."):
             return doc
 
-        tokens = ptr.lstrip("/").split("/")
+        tokens, climbs = _parse_pointer(ptr)
         cur: Any = doc
+
+        if not climbs:
+            for key, idx in tokens:
+                if isinstance(cur, (list, tuple)):
+                    cur = cur[int(key) if idx is None else idx]
+                else:
+                    cur = cur[key]
+            return cur
+
         parents: List[Tuple[Any, Any]] = []
 
-        for raw_tok in tokens:
-            if raw_tok == "..":
+        for token in tokens:
+            if token is None:  # '..'
                 if parents:
                     cur, _ = parents.pop()
                 else:
                     cur = doc
                 continue
 
-            key = self._decode(raw_tok)
-
+            key, idx = token
             if isinstance(cur, (list, tuple)):
-                idx = int(key)
+                idx = int(key) if idx is None else idx
                 parents.append((cur, idx))
                 cur = cur[idx]
             else:
@@ -133,15 +233,12 @@ class PointerResolver(ValueResolver):
 
     def _maybe_slice(self, ptr: str, src: Any) -> Any:
         """Resolve a pointer and optional Python-style slice suffix ``[start:end]`` for arrays and strings."""
-        m = self._SLICE_RE.match(ptr)
-        if m:
-            base, s, e = m.groups()
+        sliced = _parse_slice(ptr)
+        if sliced is not None:
+            base, start, end = sliced
             seq = self._get_pointer(src, base)
             if not isinstance(seq, (list, tuple, str)):
                 raise TypeError(f"{base} is not a list, tuple, or string (slice requested)")
-
-            start = int(s) if s else None
-            end = int(e) if e else None
             return seq[start:end]
 
         return self._get_pointer(src, ptr)
@@ -154,26 +251,13 @@ class PointerResolver(ValueResolver):
             create: bool = False,
     ) -> Tuple[Any, str]:
         """Return (container, leaf_key) for *ptr*, optionally creating intermediate nodes."""
-        raw_parts = ptr.lstrip("/").split("/")
-        parts: List[str] = []
-
-        for raw in raw_parts:
-            if raw == "..":
-                if parts:
-                    parts.pop()
-                continue
-            parts.append(raw)
-
-        if not parts:
-            return doc, ""
-
+        path, leaf = _parse_parent_path(ptr)
         cur: Any = doc
 
-        for raw in parts[:-1]:
-            token = self._decode(raw)
-
+        for token, idx in path:
             if isinstance(cur, list):
-                idx = int(token)
+                if idx is None:
+                    idx = int(token)
                 if idx >= len(cur):
                     if create:
                         while idx >= len(cur):
@@ -189,5 +273,4 @@ class PointerResolver(ValueResolver):
                         raise KeyError(f"{ptr}: missing key '{token}'")
                 cur = cur[token]
 
-        leaf = self._decode(parts[-1])
         return cur, leaf
@@ -43,6 +43,12 @@ from typing import Any, List, Mapping
 
 from ..core import ExecutionContext, StageMatcher, StageNode, StageProcessor, StageRegistry
 
+_ASSERT = "~assert"
+_DELETE = "~delete"
+
+# Value prefixes that turn an assign shorthand into a ``copy`` from a pointer.
+_POINTER_PREFIXES = ("/", "_:", "@:", "&:", "!:")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # ~assert / ~assertD
@@ -54,7 +60,7 @@ class AssertShorthandMatcher(StageMatcher):
 
     def matches(self, steps: List[Any], ctx: ExecutionContext) -> bool:
         return any(
-            isinstance(s, Mapping) and "op" not in s and ("~assert" in s or "~assertD" in s)
+            isinstance(s, Mapping) and "op" not in s and (_ASSERT in s or "~assertD" in s)
             for s in steps
         )
 
@@ -73,23 +79,15 @@ class AssertShorthandProcessor(StageProcessor):
     def apply(self, steps: List[Any], ctx: ExecutionContext) -> List[Any]:
         out: List[Any] = []
         for step in steps:
-            if isinstance(step, Mapping) and "op" not in step:
-                expanded = []
-                remaining = {}
-
-                for key, value in step.items():
-                    if key == "~assert":
-                        if isinstance(value, Mapping):
-                            expanded.extend(
-                                [{"op": "assert", "path": p, "equals": eq} for p, eq in value.items()]
-                            )
-                        else:
-                            paths = value if isinstance(value, list) else [value]
-                            expanded.extend([{"op": "assert", "path": p} for p in paths])
-                    else:
-                        remaining[key] = value
-
-                out.extend(expanded)
+            if isinstance(step, Mapping) and "op" not in step and _ASSERT in step:
+                value = step[_ASSERT]
+                if isinstance(value, Mapping):
+                    out += [{"op": "assert", "path": p, "equals": eq} for p, eq in value.items()]
+                else:
+                    paths = value if isinstance(value, list) else [value]
+                    out += [{"op": "assert", "path": p} for p in paths]
+
+                remaining = {k: v for k, v in step.items() if k != _ASSERT}
                 if remaining:
                     out.append(remaining)
             else:
@@ -107,7 +105,7 @@ class DeleteShorthandMatcher(StageMatcher):
 
     def matches(self, steps: List[Any], ctx: ExecutionContext) -> bool:
         return any(
-            isinstance(s, Mapping) and "op" not in s and "~delete" in s
+            isinstance(s, Mapping) and "op" not in s and _DELETE in s
             for s in steps
         )
 
@@ -122,18 +120,12 @@ class DeleteShorthandProcessor(StageProcessor):
     def apply(self, steps: List[Any], ctx: ExecutionContext) -> List[Any]:
         out: List[Any] = []
         for step in steps:
-            if isinstance(step, Mapping) and "op" not in step:
-                expanded = []
-                remaining = {}
-
-                for key, value in step.items():
-                    if key == "~delete":
-                        paths = value if isinstance(value, list) else [value]
-                        expanded.extend([{"op": "delete", "path": p} for p in paths])
-                    else:
-                        remaining[key] = value
+            if isinstance(step, Mapping) and "op" not in step and _DELETE in step:
+                value = step[_DELETE]
+                paths = value if isinstance(value, list) else [value]
+                out += [{"op": "delete", "path": p} for p in paths]
 
-                out.extend(expanded)
+                remaining = {k: v for k, v in step.items() if k != _DELETE}
                 if remaining:
                     out.append(remaining)
             else:
@@ -179,10 +171,9 @@ class AssignShorthandProcessor(StageProcessor):
                     continue
 
                 for key, value in step.items():
-                    append = key.endswith("[]")
-                    dst = f"{key[:-2]}/-" if append else key
+                    dst = key[:-2] + "/-" if key[-2:] == "[]" else key
 
-                    if isinstance(value, str) and value.startswith(("/", "_:", "@:", "&:", "!:")):
+                    if isinstance(value, str) and value.startswith(_POINTER_PREFIXES):
                         out.append({"op": "copy", "from": value, "path": dst, "ignore_missing": True})
                     else:
                         out.append({"op": "set", "path": dst, "value": value})
@@ -323,6 +323,12 @@ class TestAsyncControl:
         r3 = await run(aeng, {"op": "while", "path": "/missing", "exists": True, "do": [
             {"op": "set", "path": "/y", "value": 1}]}, dest={})
         assert r3 == {}
+        r4 = await run(aeng, {"op": "while", "path": "/missing", "equals": {"$ref": "/nope"}, "do": [
+            {"op": "set", "path": "/y", "value": 1}]}, dest={})
+        assert r4 == {}
+        r5 = await run(aeng, {"op": "while", "path": "@:/x", "equals": 1, "do": [
+            {"op": "set", "path": "/x", "value": 2}]}, dest={"x": 1})
+        assert r5 == {"x": 2}
 
     async def test_while_break_continue_maxiter_rollback(self, aeng):
         r = await run(aeng, {"op": "while", "cond": True, "do": [{"$break": None}]}, dest={"k": 1})
@@ -362,6 +368,8 @@ class TestAsyncControl:
         assert await run(aeng, {"op": "if", "path": "/x",
                                 "then": [{"op": "set", "path": "/ok", "value": 1}]},
                          source={"x": True}) == {"ok": 1}
+        assert await run(aeng, {"op": "if", "path": "/x", "equals": {"$ref": "/nope"},
+                                "then": [{"op": "set", "path": "/ok", "value": 1}]}) == {}
         with pytest.raises(ZeroDivisionError):
             await run(aeng, {"op": "if", "cond": True, "then": [
                 {"op": "set", "path": "/x", "value": {"$div": [1, 0]}}]}, dest={"keep": 1})
@@ -103,6 +103,14 @@ class TestBasicCompilation:
         assert compiled is not None
         assert compiled.steps == []
 
+    def test_compiled_step_uses_slots(self):
+        engine = build_default_engine()
+        compiled = engine.compile([{"op": "set", "path": "/x", "value": 1}])
+        step = compiled.steps[0]
+        assert isinstance(step, CompiledStep)
+        assert not hasattr(step, "__dict__")
+        assert pickle.loads(pickle.dumps(step)).step == step.step
+
     def test_compile_single_step_dict(self):
         engine = build_default_engine()
         compiled = engine.compile({"op": "set", "path": "/x", "value": 42})
@@ -1440,3 +1448,99 @@ class TestCompiledSpecOwningPipeline:
         compiled = engine.compile([{"op": "set", "path": "/x", "value": 1}])
         restored = pickle.loads(pickle.dumps(compiled))
         assert restored._pipeline is None
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Implicit compile cache used by Engine.apply / apply_async
+# ─────────────────────────────────────────────────────────────────────────────
+
+class TestCompileCache:
+    def test_disabled_by_default(self):
+        engine = build_default_engine()
+        spec = [{"op": "set", "path": "/x", "value": 1}]
+        assert engine.apply(spec, source={}, dest={}) == {"x": 1}
+        assert engine._cached_compile(spec) is None
+        assert not engine._compile_cache
+
+    def test_same_spec_object_reuses_compiled(self):
+        engine = build_default_engine(compile_cache_size=4)
+        spec = [{"op": "copy", "from": "/val", "path": "/out"}]
+        assert engine.apply(spec, source={"val": 1}, dest={}) == {"out": 1}
+        compiled = engine._cached_compile(spec)
+        assert isinstance(compiled, CompiledSpec)
+        assert engine.apply(spec, source={"val": 2}, dest={}) == {"out": 2}
+        assert engine._cached_compile(spec) is compiled
+        assert len(engine._compile_cache) == 1
+
+    def test_equal_but_distinct_spec_compiles_separately(self):
+        engine = build_default_engine(compile_cache_size=4)
+        spec_a = [{"op": "set", "path": "/x", "value": 1}]
+        spec_b = copy.deepcopy(spec_a)
+        assert engine._cached_compile(spec_a) is not engine._cached_compile(spec_b)
+
+    def test_lru_eviction(self):
+        engine = build_default_engine(compile_cache_size=2)
+        specs = [[{"op": "set", "path": "/x", "value": i}] for i in range(3)]
+        first = engine._cached_compile(specs[0])
+        engine._cached_compile(specs[1])
+        assert engine._cached_compile(specs[0]) is first  # refresh → specs[1] is LRU
+        engine._cached_compile(specs[2])
+        assert [entry[0] for entry in engine._compile_cache.values()] == [specs[0], specs[2]]
+
+    def test_clear_and_register_pipeline_invalidate(self):
+        engine = build_default_engine(compile_cache_size=4)
+        spec = [{"op": "set", "path": "/x", "value": 1}]
+        engine._cached_compile(spec)
+        engine.clear_compile_cache()
+        assert not engine._compile_cache
+        engine._cached_compile(spec)
+        engine.register_pipeline("other", engine.main_pipeline)
+        assert not engine._compile_cache
+
+    def test_uncompilable_spec_falls_back_to_run(self):
+        engine = build_default_engine(compile_cache_size=4)
+        with pytest.raises(ValueError, match="unhandled step"):
+            engine.apply([{"op": "nope"}], source={}, dest={})
+
+    def test_context_aware_pipeline_falls_back_to_run(self):
+        class CtxAwareProcessor(StageProcessor):
+            context_aware = True
+            def apply(self, steps, ctx):
+                return steps
+
+        engine = build_default_engine(compile_cache_size=4)
+        stage_reg = StageRegistry()
+        stage_reg.register(StageNode(name="ca", priority=10, processor=CtxAwareProcessor()))
+        engine.main_pipeline.stages = stage_reg
+        spec = [{"op": "set", "path": "/x", "value": 1}]
+        assert engine.apply(spec, source={}, dest={}) == {"x": 1}
+        assert engine._cached_compile(spec) is None
+
+    def test_pipeline_with_middlewares_bypasses_cache(self):
+        from j_perm import Middleware
+
+        class RenameOp(Middleware):
+            name = "rename"
+            priority = 0
+            def process(self, step, ctx):
+                if isinstance(step, dict) and step.get("op") == "put":
+                    return {**step, "op": "set"}
+                return step
+
+        engine = build_default_engine(compile_cache_size=4)
+        engine.main_pipeline.register_middleware(RenameOp())
+        spec = [{"op": "put", "path": "/x", "value": 1}]
+        assert engine.apply(spec, source={}, dest={}) == {"x": 1}
+        assert engine._cached_compile(spec) is None
+        assert not engine._compile_cache
+
+    async def test_apply_async_uses_cache(self):
+        from j_perm import build_default_async_engine
+
+        engine = build_default_async_engine(compile_cache_size=4)
+        spec = [{"op": "foreach", "in": "/items", "as": "it",
+                 "do": [{"op": "set", "path": "/out/-", "value": {"$ref": "&:/it"}}]}]
+        assert await engine.apply_async(spec, source={"items": [1, 2]}, dest={}) == {"out": [1, 2]}
+        compiled = engine._cached_compile(spec)
+        assert await engine.apply_async(spec, source={"items": [3]}, dest={}) == {"out": [3]}
+        assert engine._cached_compile(spec) is compiled
@@ -78,4 +78,107 @@ class TestGetAllHandlersWithLimits:
             source={},
             dest={},
         )
-        assert result == {"r": 10}
\ No newline at end of file
+        assert result == {"r": 10}
+
+
+class TestBuiltinCasters:
+    """BUILTIN_CASTERS is a read-only mapping of plain callables."""
+
+    def test_builtins_bound_directly(self):
+        from j_perm.casters import BUILTIN_CASTERS
+
+        assert BUILTIN_CASTERS["int"] is int
+        assert BUILTIN_CASTERS["float"] is float
+        assert BUILTIN_CASTERS["str"] is str
+
+    def test_bool_caster(self):
+        from j_perm.casters import BUILTIN_CASTERS
+
+        to_bool = BUILTIN_CASTERS["bool"]
+        assert to_bool("0") is False
+        assert to_bool("1") is True
+        assert to_bool(2) is True
+        assert to_bool([]) is False
+        with pytest.raises(ValueError):
+            to_bool("yes")
+
+    def test_read_only_but_extendable(self):
+        import pickle
+        from j_perm.casters import BUILTIN_CASTERS
+
+        with pytest.raises(TypeError):
+            BUILTIN_CASTERS["json"] = str
+        extended = {**BUILTIN_CASTERS, "upper": str.upper}
+        assert extended["bool"] is BUILTIN_CASTERS["bool"]
+        assert pickle.loads(pickle.dumps(BUILTIN_CASTERS["bool"])) is BUILTIN_CASTERS["bool"]
+
+
+class TestDefaultHandlersCache:
+    """The default-casters result is prebuilt but handed out as a fresh dict."""
+
+    def test_default_result_is_fresh_copy(self):
+        first = get_all_handlers()
+        first["$custom"] = lambda node, ctx: None
+        second = get_all_handlers()
+        assert "$custom" not in second
+        assert second["$cast"] is first["$cast"]
+
+
+class TestHandlerGroupsReadOnly:
+    """Handler group constants are shared read-only tables."""
+
+    def test_groups_reject_mutation(self):
+        from j_perm.construct_groups import CORE_HANDLERS, ALL_HANDLERS_NO_CAST
+
+        with pytest.raises(TypeError):
+            CORE_HANDLERS["$custom"] = lambda node, ctx: None
+        with pytest.raises(TypeError):
+            ALL_HANDLERS_NO_CAST["$ref"] = None
+
+    def test_groups_usable_as_specials(self):
+        from j_perm.construct_groups import CORE_HANDLERS
+
+        engine = build_default_engine(specials=CORE_HANDLERS)
+        result = engine.apply({"/x": {"$ref": "/a"}}, source={"a": 1}, dest={})
+        assert result == {"x": 1}
+
+    def test_with_limits_keeps_table_order(self):
+        """Limited handlers replace table entries in place; $cast comes last."""
+        from j_perm.construct_groups import ALL_HANDLERS_NO_CAST
+
+        handlers = get_all_handlers_with_limits(pow_max_exponent=5)
+        assert list(handlers) == [*ALL_HANDLERS_NO_CAST, "$cast"]
+        assert handlers["$div"] is ALL_HANDLERS_NO_CAST["$div"]
+        assert handlers["$pow"] is not ALL_HANDLERS_NO_CAST["$pow"]
+
+    def test_with_limits_shares_handlers_per_limits(self):
+        """Same limits reuse the built handlers; the returned dict is fresh."""
+        first = get_all_handlers_with_limits(pow_max_exponent=7)
+        first["$custom"] = lambda node, ctx: None
+        second = get_all_handlers_with_limits(pow_max_exponent=7)
+        assert "$custom" not in second
+        assert second["$pow"] is first["$pow"]
+        assert second["$regex_match"] is first["$regex_match"]
+        assert get_all_handlers_with_limits(pow_max_exponent=8)["$pow"] is not first["$pow"]
+
+    def test_with_limits_keys_on_limit_type(self):
+        """Equal limits of different types (1, 1.0, True) build separate handlers."""
+        as_int = get_all_handlers_with_limits(pow_max_exponent=1)["$pow"]
+        as_float = get_all_handlers_with_limits(pow_max_exponent=1.0)["$pow"]
+        as_bool = get_all_handlers_with_limits(pow_max_exponent=True)["$pow"]
+        assert len({id(as_int), id(as_float), id(as_bool)}) == 3
+        assert get_all_handlers_with_limits(pow_max_exponent=1)["$pow"] is as_int
+
+    def test_star_import_exposes_only_groups(self):
+        namespace = {}
+        exec("from j_perm.construct_groups import *", namespace)
+        assert "get_all_handlers" in namespace
+        assert "ALL_HANDLERS_NO_CAST" in namespace
+        assert "ref_handler" not in namespace
+        assert "make_cast_handler" not in namespace
+
+    def test_handler_names_not_bound_in_module(self):
+        import j_perm.construct_groups as groups
+
+        assert not [name for name in vars(groups) if name.endswith("_handler")]
+        assert groups.CORE_HANDLERS["$ref"] is groups._c.ref_handler
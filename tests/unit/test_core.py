@@ -18,7 +18,10 @@ from j_perm import (
     UnescapeRule,
     ValueProcessor,
 )
-from j_perm.core import _repr_step, _format_lang_stack
+from j_perm.core import (
+    Middleware, _repr_step, _format_lang_stack, _clone_json, _tuples_to_lists,
+    _map_str_leaves, _unescape_passes,
+)
 from j_perm.processors.pointer_processor import PointerProcessor
 
 
@@ -41,6 +44,14 @@ class TestExecutionContext:
         assert ctx.engine is engine
         assert ctx.metadata == {}
 
+    def test_context_is_slotted(self):
+        """ExecutionContext uses __slots__; unknown attributes are rejected."""
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+
+        assert not hasattr(ctx, "__dict__")
+        with pytest.raises(AttributeError):
+            ctx.extra = 1
+
     def test_metadata_default(self):
         """Metadata defaults to empty dict."""
         ctx = ExecutionContext(
@@ -108,6 +119,23 @@ class TestExecutionContext:
         assert ctx2.source is not ctx.source
         assert ctx2.source["a"] is not ctx.source["a"]
 
+    def test_copy_with_deepcopy_temp_stores(self):
+        """copy() can clone temp and temp_read_only independently of each other."""
+        ctx = ExecutionContext(
+            source={},
+            dest={},
+            engine=object(),
+            temp_read_only={"item": {"n": [1]}},
+            temp={"acc": [{"x": 1}]},
+        )
+
+        ctx2 = ctx.copy(deepcopy_temp_read_only=True, deepcopy_temp=True)
+
+        assert ctx2.temp_read_only == ctx.temp_read_only
+        assert ctx2.temp_read_only["item"]["n"] is not ctx.temp_read_only["item"]["n"]
+        assert ctx2.temp == ctx.temp
+        assert ctx2.temp["acc"][0] is not ctx.temp["acc"][0]
+
     def test_copy_with_new_dest(self):
         """copy() can override dest."""
         ctx = ExecutionContext(
@@ -266,6 +294,17 @@ class TestStageRegistry:
 class TestActionTypeRegistry:
     """Test ActionTypeRegistry."""
 
+    def test_nodes_and_rules_are_slotted(self):
+        """Tree nodes and unescape rules carry no per-instance __dict__."""
+        nodes = [
+            ActionNode("a", 0, matcher=None),
+            StageNode("s", 0),
+            UnescapeRule(name="u", priority=0, unescape=lambda v: v),
+        ]
+
+        for node in nodes:
+            assert not hasattr(node, "__dict__")
+
     def test_resolve_returns_empty_for_no_match(self):
         """resolve() returns empty list if no matcher matches."""
         registry = ActionTypeRegistry()
@@ -435,6 +474,221 @@ class TestPipeline:
         pipeline.run({}, ctx)
         assert executed_order == ["stage", "handler"]
 
+    @staticmethod
+    def _counting_pipeline(context_aware=False):
+        calls = []
+
+        class CountStage(StageProcessor):
+            def apply(self, steps, ctx):
+                calls.append(list(steps))
+                return steps
+
+        CountStage.context_aware = context_aware
+
+        class TestHandler(ActionHandler):
+            def execute(self, step, ctx):
+                ctx.dest.setdefault("n", 0)
+                ctx.dest["n"] += 1
+                return ctx.dest
+
+        stages = StageRegistry()
+        stages.register(StageNode("count", 10, processor=CountStage()))
+        registry = ActionTypeRegistry()
+        registry.register(ActionNode("any", 10, _AnyMatcher(), handler=TestHandler()))
+        return Pipeline(stages=stages, registry=registry), calls
+
+    def test_stage_output_reused_within_one_run(self):
+        """Re-running the same spec object in one context skips the stages."""
+        pipeline, calls = self._counting_pipeline()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = [{"op": "x"}]
+        for _ in range(4):
+            pipeline.run(body, ctx)
+        pipeline.run([{"op": "x"}], ctx)  # equal but distinct object
+        assert ctx.dest == {"n": 5}
+        # Normalised on the first two runs (the second one caches), then reused
+        assert len(calls) == 3
+
+    def test_one_shot_specs_are_not_snapshotted(self):
+        """A spec seen once is only referenced; the cache stays bounded."""
+        from j_perm.core import _STAGE_CACHE_SIZE
+
+        pipeline, calls = self._counting_pipeline()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        for _ in range(_STAGE_CACHE_SIZE * 3):
+            pipeline.run([{"op": "x"}], ctx)
+        cache = ctx.metadata["_stage_cache"]
+        assert len(cache) == _STAGE_CACHE_SIZE
+        assert all(len(entry) == 1 for entry in cache.values())
+        assert len(calls) == _STAGE_CACHE_SIZE * 3
+
+    def test_stage_cache_evicts_least_recently_used(self):
+        from j_perm.core import _STAGE_CACHE_SIZE
+
+        pipeline, calls = self._counting_pipeline()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        hot = [{"op": "x"}]
+        pipeline.run(hot, ctx)
+        pipeline.run(hot, ctx)
+        for _ in range(_STAGE_CACHE_SIZE * 2):
+            pipeline.run(hot, ctx)
+            pipeline.run([{"op": "y"}], ctx)
+        assert len(ctx.metadata["_stage_cache"]) == _STAGE_CACHE_SIZE
+        # hot stays cached throughout; every fresh body is normalised once
+        assert len(calls) == 2 + _STAGE_CACHE_SIZE * 2
+
+    def test_stage_cache_is_per_context(self):
+        pipeline, calls = self._counting_pipeline()
+        body = [{"op": "x"}]
+        for _ in range(2):
+            pipeline.run(body, ExecutionContext(source={}, dest={}, engine=object()))
+        assert len(calls) == 2
+
+    def test_context_aware_stages_are_not_cached(self):
+        pipeline, calls = self._counting_pipeline(context_aware=True)
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = [{"op": "x"}]
+        pipeline.run(body, ctx)
+        pipeline.run(body, ctx)
+        assert len(calls) == 2
+        assert "_stage_cache" not in ctx.metadata
+
+    def test_spec_edited_in_place_is_renormalised(self):
+        """A body mutated during the run (e.g. one read from dest) misses the cache."""
+        pipeline, calls = self._counting_pipeline()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = [{"op": "x"}]
+        pipeline.run(body, ctx)
+        body.append({"op": "y"})
+        pipeline.run(body, ctx)
+        body[1]["op"] = "z"
+        pipeline.run(body, ctx)
+        pipeline.run(body, ctx)
+        assert len(calls) == 3
+        assert ctx.dest == {"n": 7}
+
+    def test_context_aware_stage_registered_later_disables_cache(self):
+        pipeline, calls = self._counting_pipeline()
+
+        class AwareStage(StageProcessor):
+            context_aware = True
+
+            def apply(self, steps, ctx):
+                return steps
+
+        assert pipeline._stages_context_free()
+        pipeline.stages.register(StageNode("aware", 0, processor=AwareStage()))
+        assert not pipeline._stages_context_free()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        pipeline.run([{"op": "x"}], ctx)
+        assert "_stage_cache" not in ctx.metadata
+
+    def test_context_aware_stage_in_group_disables_cache(self):
+        """A context-aware stage mounted via register_group is re-run per iteration."""
+        from j_perm import build_default_engine
+
+        class CountOut(StageProcessor):
+            context_aware = True
+
+            def apply(self, steps, ctx):
+                return [
+                    {"op": "set", "path": "/out/-", "value": len(ctx.dest.get("out", []))}
+                    if isinstance(step, dict) and "~count" in step else step
+                    for step in steps
+                ]
+
+        engine = build_default_engine()
+        group = StageRegistry()
+        engine.main_pipeline.stages.register_group("grp", group, priority=1000)
+        assert engine.main_pipeline._stages_context_free()
+        # Registered after mounting: the parent still sees it
+        group.register(StageNode("count_out", 0, processor=CountOut()))
+        assert not engine.main_pipeline._stages_context_free()
+
+        spec = {"op": "foreach", "in": "/xs", "as": "x", "do": [{"~count": True}]}
+        result = engine.apply(spec, source={"xs": [1, 2, 3]}, dest={})
+        assert result == {"out": [0, 1, 2]}
+
+    def test_grouped_context_aware_stage_rebinds_handlers(self):
+        """Steps whose op depends on the context are resolved afresh each time."""
+        from j_perm import build_default_engine
+
+        class FirstSetThenCopy(StageProcessor):
+            context_aware = True
+
+            def apply(self, steps, ctx):
+                if steps != [{"op": "noop"}]:
+                    return steps
+                if ctx.dest.get("out"):
+                    return [{"op": "copy", "from": "&:/x", "path": "/out/-"}]
+                return [{"op": "set", "path": "/out/-", "value": "first"}]
+
+        engine = build_default_engine()
+        group = StageRegistry()
+        group.register(StageNode("switch", 0, processor=FirstSetThenCopy()))
+        engine.main_pipeline.stages.register_group("grp", group, priority=1000)
+
+        spec = {"op": "foreach", "in": "/xs", "as": "x", "do": [{"op": "noop"}]}
+        result = engine.apply(spec, source={"xs": [1, 2, 3]}, dest={})
+        assert result == {"out": ["first", 2, 3]}
+
+    def test_handlers_bound_once_per_cached_spec(self):
+        """Cached step lists also carry their resolved handlers."""
+        seen = []
+
+        class CountingMatcher(ActionMatcher):
+            def matches(self, step):
+                seen.append(step)
+                return True
+
+        pipeline, _ = self._counting_pipeline()
+        node = pipeline.registry.nodes()[0]
+        pipeline.registry = ActionTypeRegistry()
+        pipeline.registry.register(ActionNode(node.name, node.priority, CountingMatcher(),
+                                              handler=node.handler))
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = [{"op": "x"}, {"op": "y"}]
+        for _ in range(4):
+            pipeline.run(body, ctx)
+        assert ctx.dest == {"n": 8}
+        # Resolved per step on the first run, bound on the second, then reused
+        assert len(seen) == 4
+
+    def test_middleware_disables_handler_binding(self):
+        pipeline, _ = self._counting_pipeline()
+        rewritten = []
+
+        class Rewrite(Middleware):
+            name = "rewrite"
+            priority = 10
+
+            def process(self, step, ctx):
+                rewritten.append(step)
+                return step
+
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = [{"op": "x"}]
+        pipeline.run(body, ctx)
+        pipeline.register_middleware(Rewrite())
+        pipeline.run(body, ctx)
+        pipeline.run(body, ctx)
+        assert ctx.dest == {"n": 3}
+        assert len(rewritten) == 2
+
+    async def test_stage_output_reused_within_one_async_run(self):
+        pipeline, calls = self._counting_pipeline()
+        ctx = ExecutionContext(source={}, dest={}, engine=object())
+        body = {"op": "x"}
+        for _ in range(3):
+            await pipeline.run_async(body, ctx)
+        assert ctx.dest == {"n": 3}
+        assert len(calls) == 2
+
+
+class _AnyMatcher(ActionMatcher):
+    def matches(self, step):
+        return True
+
 
 class TestEngine:
     """Test Engine."""
@@ -467,6 +721,49 @@ class TestEngine:
         assert result == {"key": "value"}
         assert dest == {}  # original unchanged
 
+    def test_apply_copy_result_false_returns_working_document(self):
+        """copy_result=False hands back ctx.dest itself; dest is still isolated."""
+        seen = []
+
+        class SetHandler(ActionHandler):
+            def execute(self, step, ctx):
+                ctx.dest["key"] = "value"
+                seen.append(ctx.dest)
+                return ctx.dest
+
+        class AlwaysMatcher(ActionMatcher):
+            def matches(self, step):
+                return True
+
+        registry = ActionTypeRegistry()
+        registry.register(ActionNode("set", 10, AlwaysMatcher(), handler=SetHandler()))
+        engine = Engine(
+            resolver=PointerResolver(),
+            processor=PointerProcessor(),
+            main_pipeline=Pipeline(registry=registry),
+        )
+
+        dest = {}
+        result = engine.apply({}, source={}, dest=dest, copy_result=False)
+
+        assert result == {"key": "value"}
+        assert result is seen[-1]
+        assert dest == {}
+        assert engine.apply({}, source={}, dest=dest) is not seen[-1]
+
+    def test_apply_to_context_copy_result_false_returns_ctx_dest(self):
+        """apply_to_context(copy_result=False) returns ctx.dest without cloning."""
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        spec = {"op": "set", "path": "/a", "value": 1}
+        ctx = ExecutionContext(source={}, dest={}, engine=engine)
+
+        assert engine.apply_to_context(spec, ctx, copy_result=False) is ctx.dest
+        copied = engine.apply_to_context(spec, ctx)
+        assert copied == ctx.dest == {"a": 1}
+        assert copied is not ctx.dest
+
     def test_process_value_returns_unchanged_if_no_value_pipeline(self):
         """process_value with no value_pipeline returns value as-is."""
 
@@ -633,6 +930,200 @@ class TestFormatLangStack:
         assert "frame1" in result
 
 
+class TestCloneJson:
+    """Test _clone_json private helper."""
+
+    def test_nested_containers_are_independent(self):
+        data = {"a": [1, {"b": "x"}], "c": None, "d": 1.5, "e": True}
+        clone = _clone_json(data)
+        assert clone == data
+        assert clone is not data
+        assert clone["a"] is not data["a"]
+        assert clone["a"][1] is not data["a"][1]
+        clone["a"][1]["b"] = "y"
+        assert data["a"][1]["b"] == "x"
+
+    def test_scalars_returned_as_is(self):
+        for value in ("s", 1, 2.0, False, None):
+            assert _clone_json(value) is value
+
+    def test_non_json_values_fall_back_to_deepcopy(self):
+        from collections import OrderedDict
+
+        inner = [1, 2]
+        data = {"t": (inner,), "o": OrderedDict(k=[3])}
+        clone = _clone_json(data)
+        assert clone == data
+        assert type(clone["t"]) is tuple and clone["t"][0] is not inner
+        assert type(clone["o"]) is OrderedDict and clone["o"]["k"] is not data["o"]["k"]
+
+
+class TestTuplesToLists:
+    """Test _tuples_to_lists private helper."""
+
+    def test_tuple_free_input_returned_unchanged(self):
+        data = {"a": [1, {"b": [2]}], "c": "x"}
+        assert _tuples_to_lists(data) is data
+
+    def test_nested_tuples_converted(self):
+        data = {"a": [1, {"b": (2, (3,))}], "c": (4,)}
+        assert _tuples_to_lists(data) == {"a": [1, {"b": [2, [3]]}], "c": [4]}
+        assert _tuples_to_lists((1, 2)) == [1, 2]
+
+    def test_tuple_free_subtrees_are_shared(self):
+        shared = {"deep": [1, 2]}
+        data = {"keep": shared, "items": [shared, (1,)]}
+        result = _tuples_to_lists(data)
+        assert result == {"keep": {"deep": [1, 2]}, "items": [{"deep": [1, 2]}, [1]]}
+        assert result is not data and result["keep"] is shared
+        assert result["items"][0] is shared
+        assert data["items"][1] == (1,)
+
+    def test_engine_source_with_tuples_visible_to_jmespath(self):
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        result = engine.apply({"op": "set", "path": "/n", "value": "${?length(source.items)}"},
+                              source={"items": (1, 2, 3)}, dest={})
+        assert result == {"n": 3}
+
+    def test_uncopied_source_is_not_mutated_through_dest(self):
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        source = {"a": {"b": [1, 2]}}
+        result = engine.apply([
+            {"op": "set", "path": "/x", "value": "${/a}"},
+            {"op": "set", "path": "/x/b/-", "value": 3},
+            {"op": "set", "path": "/y", "value": {"$raw": "${/a}"}},
+        ], source=source, dest={})
+        assert result["x"] == {"b": [1, 2, 3]}
+        assert source == {"a": {"b": [1, 2]}}
+
+    def test_engine_without_unescape_rules_does_not_alias_inputs(self):
+        from j_perm import build_default_engine
+
+        base = build_default_engine()
+        engine = Engine(
+            resolver=base.resolver,
+            processor=base.processor,
+            main_pipeline=base.main_pipeline,
+            value_pipeline=base.value_pipeline,
+        )
+        source = {"a": {"b": [1, 2]}}
+        spec = [
+            {"op": "set", "path": "/x", "value": "${/a}"},
+            {"op": "set", "path": "/x/b/-", "value": 3},
+            {"op": "set", "path": "/y", "value": {"c": []}},
+            {"op": "set", "path": "/y/c/-", "value": 4},
+        ]
+        expected = {"x": {"b": [1, 2, 3]}, "y": {"c": [4]}}
+        assert engine.apply(spec, source=source, dest={}) == expected
+        assert engine.apply(spec, source=source, dest={}) == expected
+        assert source == {"a": {"b": [1, 2]}}
+        assert spec[2]["value"] == {"c": []}
+
+    def test_identity_unescape_rule_does_not_alias_source(self):
+        """A custom rule that returns its input still leaves source untouched."""
+        from j_perm import build_default_engine
+
+        base = build_default_engine()
+        engine = Engine(
+            resolver=base.resolver,
+            processor=base.processor,
+            main_pipeline=base.main_pipeline,
+            value_pipeline=base.value_pipeline,
+            unescape_rules=[UnescapeRule(name="same", priority=0, unescape=lambda v: v)],
+        )
+        source = {"a": [1, 2]}
+        spec = [
+            {"op": "set", "path": "/x", "value": "${/a}"},
+            {"op": "set", "path": "/x/-", "value": 99},
+        ]
+        assert engine.apply(spec, source=source, dest={}) == {"x": [1, 2, 99]}
+        assert source == {"a": [1, 2]}
+
+    def test_repeated_apply_does_not_mutate_spec_literals(self):
+        """Container literals written into dest are fresh objects, not the spec's own."""
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        spec = [
+            {"op": "set", "path": "/a", "value": {"b": []}},
+            {"op": "set", "path": "/a/b/-", "value": 1},
+        ]
+
+        assert engine.apply(spec, source={}, dest={}) == {"a": {"b": [1]}}
+        assert engine.apply(spec, source={}, dest={}) == {"a": {"b": [1]}}
+        assert spec[0]["value"] == {"b": []}
+
+
+class TestMapStrLeaves:
+    """Tests for _map_str_leaves and the fused passes built by _unescape_passes."""
+
+    def test_maps_strings_inside_lists_and_tuples(self):
+        result = _map_str_leaves(str.upper, ["a", ("b", ["c"]), "d"])
+        assert result == ["A", ("B", ["C"]), "D"]
+        assert isinstance(result[1], tuple)
+        assert isinstance(result[1][1], list)
+
+    def test_non_string_scalars_pass_through(self):
+        leaves = [1, 2.5, True, None]
+        assert _map_str_leaves(str.upper, leaves) == leaves
+        assert _map_str_leaves(str.upper, 7) == 7
+        assert _map_str_leaves(str.upper, None) is None
+
+    def test_maps_string_keys_only(self):
+        from types import MappingProxyType
+
+        result = _map_str_leaves(str.upper, MappingProxyType({"k": "v", 1: "w"}))
+        assert result == {"K": "V", 1: "W"}
+        assert type(result) is dict
+
+    def test_containers_are_rebuilt(self):
+        inner = ["x"]
+        doc = {"a": inner}
+        result = _map_str_leaves(lambda s: s, doc)
+        assert result == doc
+        assert result is not doc
+        assert result["a"] is not inner
+
+    def test_fused_pass_matches_rules_run_in_sequence(self):
+        from j_perm.handlers.template import template_unescape, template_unescape_str
+
+        def pct_str(text):
+            return text.replace("%%", "%")
+
+        rules = [
+            UnescapeRule(name="template", priority=20, unescape=template_unescape,
+                         leaf=template_unescape_str),
+            UnescapeRule(name="pct", priority=10,
+                         unescape=lambda obj: _map_str_leaves(pct_str, obj), leaf=pct_str),
+            UnescapeRule(name="template2", priority=0, unescape=template_unescape,
+                         leaf=template_unescape_str),
+        ]
+        doc = {
+            "$$$${k}": ["$$$$x", ("%%%%$$", 3), None],
+            "n": {"%%%%": 1.5, 2: "$$${y}"},
+            "b": True,
+        }
+
+        passes = _unescape_passes(rules)
+        assert len(passes) == 1
+
+        fused, sequential = doc, doc
+        for fn in passes:
+            fused = fn(fused)
+        for rule in rules:
+            sequential = rule.unescape(sequential)
+        assert fused == sequential
+        assert fused == {
+            "${k}": ["$x", ("%%$", 3), None],
+            "n": {"%%": 1.5, 2: "${y}"},
+            "b": True,
+        }
+
+
 class TestValueProcessorExistsBaseMethod:
     """Test ValueProcessor.exists() default base implementation (lines 221-222)."""
 
@@ -864,6 +1355,89 @@ class TestActionTypeRegistryExtended:
         assert priorities == sorted(priorities, reverse=True)
 
 
+    def test_equal_priorities_keep_registration_order(self):
+        """Nodes are kept sorted on register; ties stay in registration order."""
+        registry = ActionTypeRegistry()
+
+        class M(ActionMatcher):
+            def matches(self, step):
+                return False
+
+        for name, priority in [("a", 5), ("b", 10), ("c", 5), ("d", 10)]:
+            registry.register(ActionNode(name, priority, M()))
+
+        assert [n.name for n in registry.nodes()] == ["b", "d", "a", "c"]
+        registry.nodes().clear()
+        assert len(registry.nodes()) == 4
+
+
+    def test_op_keyed_nodes_are_skipped_for_other_ops(self):
+        """Matchers with op_key are only consulted for steps carrying that op."""
+        from j_perm import OpMatcher
+
+        calls = []
+
+        class Recording(OpMatcher):
+            def __init__(self, op):
+                super().__init__(op)
+                self.op_key = op  # still only true for this op
+
+            def matches(self, step):
+                calls.append(self._op)
+                return super().matches(step)
+
+        class Always(ActionMatcher):
+            def matches(self, step):
+                return True
+
+        class H(ActionHandler):
+            def __init__(self, name):
+                self.name = name
+
+            def execute(self, step, ctx):
+                return ctx.dest
+
+        registry = ActionTypeRegistry()
+        set_h, copy_h, fallback_h = H("set"), H("copy"), H("fallback")
+        registry.register(ActionNode("set", 10, Recording("set"), handler=set_h))
+        registry.register(ActionNode("copy", 10, Recording("copy"), handler=copy_h))
+        registry.register(ActionNode("fallback", 0, Always(), handler=fallback_h))
+
+        assert registry.resolve({"op": "copy"}) == [copy_h]
+        assert calls == ["copy"]
+        assert registry.resolve({"op": "other"}) == [fallback_h]
+        assert registry.resolve("text") == [fallback_h]
+        assert calls == ["copy"]
+
+        late_h = H("late")
+        registry.register(ActionNode("late", 20, Recording("copy"), handler=late_h))
+        assert registry.resolve({"op": "copy"}) == [late_h]
+
+    def test_op_matcher_subclass_overriding_matches_drops_op_key(self):
+        """A widened matches() must not be hidden behind the parent's op_key."""
+        from j_perm import OpMatcher
+
+        class SetOrAlias(OpMatcher):
+            def matches(self, step):
+                return super().matches(step) or (
+                    isinstance(step, dict) and step.get("op") == "assign")
+
+        class H(ActionHandler):
+            def execute(self, step, ctx):
+                return ctx.dest
+
+        assert OpMatcher("set").op_key == "set"
+        assert SetOrAlias("set").op_key is None
+
+        registry = ActionTypeRegistry()
+        handler = H()
+        registry.register(ActionNode("set", 10, SetOrAlias("set"), handler=handler))
+        registry.register(ActionNode("copy", 10, OpMatcher("copy"), handler=H()))
+
+        assert registry.resolve({"op": "set"}) == [handler]
+        assert registry.resolve({"op": "assign"}) == [handler]
+
+
 class TestPipelineMiddleware:
     """Test Pipeline middleware support."""
 
@@ -904,9 +1478,164 @@ class TestPipelineMiddleware:
         assert len(transformed) == 1
 
 
+    def test_middlewares_run_by_descending_priority(self):
+        """Middlewares are ordered once on registration, highest priority first."""
+        from j_perm.core import Middleware
+
+        seen = []
+
+        def make(name, prio):
+            class M(Middleware):
+                priority = prio
+
+                def process(self, step, ctx):
+                    seen.append(name)
+                    return step
+            M.name = name
+            return M()
+
+        class AnyMatcher(ActionMatcher):
+            def matches(self, step):
+                return True
+
+        class Noop(ActionHandler):
+            def execute(self, step, ctx):
+                return ctx.dest
+
+        registry = ActionTypeRegistry()
+        registry.register(ActionNode("noop", 0, AnyMatcher(), handler=Noop()))
+        pipeline = Pipeline(registry=registry, middlewares=[make("low", 1), make("high", 9)])
+        pipeline.register_middleware(make("mid", 5))
+
+        pipeline.run({"op": "x"}, ExecutionContext(source={}, dest={}, engine=object()))
+        assert seen == ["high", "mid", "low"]
+
+
 class TestEngineExtended:
     """Extended tests for Engine."""
 
+    def test_adjacent_leaf_unescape_rules_share_one_walk(self):
+        """Leaf rules fuse into one pass; priority order is kept around other rules."""
+        from j_perm import build_default_engine
+
+        walks = []
+
+        def leaf_rule(name, priority, old, new):
+            def leaf(text):
+                return text.replace(old, new)
+
+            def unescape(obj):
+                walks.append(name)
+                return {k: leaf(v) for k, v in obj.items()} if isinstance(obj, dict) else obj
+            return UnescapeRule(name=name, priority=priority, unescape=unescape, leaf=leaf)
+
+        def upper(obj):
+            walks.append("upper")
+            return {k: v.upper() for k, v in obj.items()} if isinstance(obj, dict) else obj
+
+        base = build_default_engine()
+        engine = Engine(
+            resolver=base.resolver,
+            processor=base.processor,
+            main_pipeline=base.main_pipeline,
+            value_pipeline=base.value_pipeline,
+            unescape_rules=[
+                leaf_rule("a", 30, "a", "b"),
+                leaf_rule("b", 20, "b", "c"),
+                UnescapeRule(name="upper", priority=10, unescape=upper),
+                leaf_rule("c", 0, "C", "x"),
+            ],
+        )
+        ctx = ExecutionContext(source={}, dest={}, engine=engine)
+
+        assert engine.process_value({"a": "ab"}, ctx) == {"c": "xx"}
+        # Leaf rules run through the engine's walk, never their own unescape
+        assert walks == ["upper"]
+
+    def test_register_unescape_rule_rebuilds_passes(self):
+        from j_perm import build_default_engine
+
+        engine = build_default_engine(result_cache_size=4)
+        spec = {"/v": "%%$${x}"}
+        assert engine.apply(spec, source={}, dest={}) == {"v": "%%${x}"}
+
+        def pct(text):
+            return text.replace("%%", "%")
+
+        engine.register_unescape_rule(UnescapeRule(name="pct", priority=10, unescape=pct, leaf=pct))
+        assert [r.name for r in engine.unescape_rules] == ["pct", "template"]
+        assert len(engine._unescape_passes) == 1
+        assert engine.apply(spec, source={}, dest={}) == {"v": "%${x}"}
+
+    def test_unescape_rules_are_read_only(self):
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        with pytest.raises(AttributeError):
+            engine.unescape_rules.append(UnescapeRule(name="x", priority=0, unescape=lambda v: v))
+
+    def test_process_value_skips_pipeline_for_inert_scalars(self, monkeypatch):
+        """Scalars only the identity fallback would handle never enter the loop."""
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        ctx = ExecutionContext(source={"a": 7}, dest={}, engine=engine)
+        runs = []
+        original_run = engine.value_pipeline.run
+
+        def counting_run(spec, run_ctx, **kwargs):
+            runs.append(spec)
+            return original_run(spec, run_ctx, **kwargs)
+
+        monkeypatch.setattr(engine.value_pipeline, "run", counting_run)
+
+        assert engine.process_value("plain", ctx) == "plain"
+        assert engine.process_value(3, ctx) == 3
+        assert engine.process_value(None, ctx) is None
+        assert engine.process_value("$${x}", ctx) == "${x}"
+        assert runs == []
+
+        assert engine.process_value("${/a}", ctx) == 7
+        assert engine.process_value([1], ctx) == [1]
+        assert runs
+
+    def test_probed_scalar_is_resolved_once_per_value(self, monkeypatch):
+        """The probe's handler list serves the first iteration; no second resolve."""
+        from j_perm import build_default_engine
+
+        engine = build_default_engine()
+        ctx = ExecutionContext(source={"a": 7}, dest={}, engine=engine)
+        resolved = []
+        registry = engine.value_pipeline.registry
+        original_resolve = registry.resolve
+
+        def counting_resolve(step):
+            resolved.append(step)
+            return original_resolve(step)
+
+        monkeypatch.setattr(registry, "resolve", counting_resolve)
+
+        assert engine.process_value("${/a}", ctx) == 7
+        assert resolved == ["${/a}", 7]
+
+    async def test_probed_scalar_is_resolved_once_per_value_async(self, monkeypatch):
+        from j_perm import build_default_async_engine
+
+        engine = build_default_async_engine()
+        ctx = ExecutionContext(source={"a": 7}, dest={}, engine=engine)
+        resolved = []
+        registry = engine.value_pipeline.registry
+        original_resolve = registry.resolve
+
+        def counting_resolve(step):
+            resolved.append(step)
+            return original_resolve(step)
+
+        monkeypatch.setattr(registry, "resolve", counting_resolve)
+
+        assert await engine.process_value_async("${/a}", ctx) == 7
+        assert resolved == ["${/a}", 7]
+
     def _make_engine(self, handler_cls=None, *, track_execution=True):
         """Helper to build a minimal engine."""
         class AlwaysMatcher(ActionMatcher):
@@ -1219,3 +1948,116 @@ class TestEngineExtended:
             assert result == "transformed"
         finally:
             log.setLevel(original_level)
+
+
+class TestResultCache:
+    """Engine result memoisation (result_cache_size)."""
+
+    @staticmethod
+    def _counting_engine(**kwargs):
+        from j_perm import build_default_engine
+
+        calls = []
+        engine = build_default_engine(
+            specials={"$tick": lambda node, ctx: calls.append(1) or len(calls)}, **kwargs
+        )
+        return engine, calls
+
+    def test_disabled_by_default(self):
+        engine, calls = self._counting_engine()
+        spec = {"/n": {"$tick": None}}
+        engine.apply(spec, source={}, dest={})
+        engine.apply(spec, source={}, dest={})
+        assert len(calls) == 2 and not engine._result_cache
+
+    def test_identical_inputs_hit(self):
+        engine, calls = self._counting_engine(result_cache_size=4)
+        spec = {"/n": {"$tick": None}}
+        first = engine.apply(spec, source={"a": [1]}, dest={})
+        second = engine.apply(spec, source={"a": [1]}, dest={})
+        assert first == second == {"n": 1} and len(calls) == 1
+        second["n"] = 99
+        assert engine.apply(spec, source={"a": [1]}, dest={}) == {"n": 1}
+
+    def test_different_inputs_or_spec_miss(self):
+        engine, calls = self._counting_engine(result_cache_size=4)
+        spec = {"/n": {"$tick": None}}
+        engine.apply(spec, source={"a": 1}, dest={})
+        engine.apply(spec, source={"a": 2}, dest={})
+        engine.apply(spec, source={"a": 1}, dest={"x": 1})
+        engine.apply(dict(spec), source={"a": 1}, dest={})
+        assert len(calls) == 4
+
+    def test_key_order_is_part_of_the_key(self):
+        """Inputs differing only in key order are distinct entries."""
+        from j_perm import build_default_engine
+
+        engine = build_default_engine(result_cache_size=8)
+        spec = [{"op": "set", "path": "/k", "value": {"$keys": {"$ref": "/"}}}]
+        assert engine.apply(spec, source={"a": 1, "b": 2}, dest={}) == {"k": ["a", "b"]}
+        assert engine.apply(spec, source={"b": 2, "a": 1}, dest={}) == {"k": ["b", "a"]}
+        append = [{"op": "set", "path": "/z", "value": 1}]
+        assert list(engine.apply(append, source={}, dest={"x": 1, "y": 2})) == ["x", "y", "z"]
+        assert list(engine.apply(append, source={}, dest={"y": 2, "x": 1})) == ["y", "x", "z"]
+        assert len(engine._result_cache) == 4
+
+    def test_non_json_inputs_are_not_memoised(self):
+        engine, calls = self._counting_engine(result_cache_size=4)
+        spec = {"/n": {"$tick": None}}
+        for source in ({1: "a"}, {"t": (1,)}, {"o": object()}):
+            engine.apply(spec, source=source, dest={})
+            engine.apply(spec, source=source, dest={})
+        assert len(calls) == 6 and not engine._result_cache
+
+    def test_lru_and_invalidation(self):
+        engine, calls = self._counting_engine(result_cache_size=1)
+        spec = {"/n": {"$tick": None}}
+        engine.apply(spec, source={"a": 1}, dest={})
+        engine.apply(spec, source={"a": 2}, dest={})
+        assert len(engine._result_cache) == 1
+        engine.clear_result_cache()
+        assert not engine._result_cache
+        engine.apply(spec, source={"a": 1}, dest={})
+        engine.register_custom_function("helper", lambda: None)
+        assert not engine._result_cache
+        engine.apply(spec, source={"a": 1}, dest={})
+        engine.register_pipeline("other", engine.main_pipeline)
+        assert not engine._result_cache
+
+    def test_spec_edited_in_place_misses(self):
+        from j_perm import build_default_engine
+
+        engine = build_default_engine(result_cache_size=4)
+        spec = [{"op": "set", "path": "/x", "value": 1}]
+        assert engine.apply(spec, source={}, dest={}) == {"x": 1}
+        spec[0]["value"] = 2
+        assert engine.apply(spec, source={}, dest={}) == {"x": 2}
+
+    def test_direct_registry_mutation_invalidates(self):
+        """Nodes registered straight on a pipeline's registries drop stale results."""
+        from j_perm import OpMatcher
+
+        class Stamp(ActionHandler):
+            def execute(self, step, ctx):
+                return {"stamped": True}
+
+        class Rewrite(StageProcessor):
+            def apply(self, steps, ctx):
+                return [{"op": "set", "path": "/rewritten", "value": True}]
+
+        engine, _ = self._counting_engine(result_cache_size=4)
+        spec = [{"op": "copy", "from": "/a", "path": "/b"}]
+        assert engine.apply(spec, source={"a": 1}, dest={}) == {"b": 1}
+        engine.main_pipeline.stages.register(StageNode("rewrite", 1000, processor=Rewrite()))
+        assert engine.apply(spec, source={"a": 1}, dest={}) == {"rewritten": True}
+        engine.main_pipeline.registry.register(ActionNode("stamp", 1000, OpMatcher("set"), handler=Stamp()))
+        assert engine.apply(spec, source={"a": 1}, dest={}) == {"stamped": True}
+
+    async def test_async_hit(self):
+        from j_perm import build_default_async_engine
+
+        engine = build_default_async_engine(result_cache_size=4)
+        spec = {"/x": "${/a}"}
+        assert await engine.apply_async(spec, source={"a": 1}, dest={}) == {"x": 1}
+        assert len(engine._result_cache) == 1
+        assert await engine.apply_async(spec, source={"a": 1}, dest={}) == {"x": 1}
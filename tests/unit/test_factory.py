@@ -158,3 +158,57 @@ class TestBuildDefaultEngine:
         )
 
         assert result == {"test": "${literal}"}
+
+
+class TestLazyPackageExports:
+    """``j_perm`` resolves non-core exports on first attribute access."""
+
+    def test_every_public_name_resolves(self):
+        import j_perm
+
+        for name in j_perm.__all__:
+            assert getattr(j_perm, name) is not None
+        assert set(j_perm.__all__) <= set(dir(j_perm))
+
+    def test_submodule_attribute_imported_on_demand(self, monkeypatch):
+        import j_perm
+        import j_perm.text as text_module
+
+        monkeypatch.delattr(j_perm, "text")
+        assert j_perm.text is text_module
+
+    def test_unknown_attribute_raises(self):
+        import j_perm
+
+        with pytest.raises(AttributeError, match="no attribute 'nope'"):
+            j_perm.nope
+
+    def test_import_does_not_load_optional_dependencies(self):
+        import os
+        import subprocess
+        import sys
+
+        code = "import sys, j_perm; print('yaml' in sys.modules, 'regex' in sys.modules)"
+        env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env)
+        assert out.stdout.split() == ["False", "False"]
+
+    def test_type_checking_imports_mirror_lazy_exports(self):
+        """The ``TYPE_CHECKING`` block names exactly the lazily exported symbols."""
+        import ast
+        import inspect
+
+        import j_perm
+
+        tree = ast.parse(inspect.getsource(j_perm))
+        block = next(
+            node for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        eager = {
+            (f".{imp.module}", alias.name)
+            for imp in block.body if isinstance(imp, ast.ImportFrom)
+            for alias in imp.names
+        }
+        lazy = {(module, name) for module, names in j_perm._LAZY_EXPORTS.items() for name in names}
+        assert eager == lazy
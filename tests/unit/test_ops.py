@@ -970,6 +970,40 @@ class TestIfAdditional:
 
         assert result == {"result": "yes"}
 
+    def test_if_path_equals_missing_skips_equals(self):
+        """A missing path is never equal, so ``equals`` is not evaluated."""
+        engine = build_default_engine()
+
+        result = engine.apply(
+            {
+                "op": "if",
+                "path": "/status",
+                "equals": {"$ref": "/also_missing"},
+                "then": {"/result": "yes"},
+                "else": {"/result": "no"},
+            },
+            source={},
+            dest={},
+        )
+
+        assert result == {"result": "no"}
+
+    def test_if_branch_mutates_live_dest(self):
+        """The taken branch writes straight into the running dest."""
+        engine = build_default_engine()
+
+        result = engine.apply(
+            [
+                {"op": "set", "path": "/items", "value": [1]},
+                {"op": "if", "cond": True, "then": [{"op": "set", "path": "/items/-", "value": 2}]},
+                {"op": "set", "path": "/items/-", "value": 3},
+            ],
+            source={},
+            dest={},
+        )
+
+        assert result == {"items": [1, 2, 3]}
+
 
 class TestUpdateAdditional:
     """Additional update tests for uncovered branches."""
@@ -200,6 +200,26 @@ class TestPointerResolverExists:
         assert resolver.exists("/missing", data) is False
         assert resolver.exists("/a/missing", data) is False
 
+    def test_exists_agrees_with_get(self):
+        """The non-raising probe gives the same answer as a get() attempt."""
+        resolver = PointerResolver()
+        data = {"a": [10, {"b": None}], "s": "text", "t": (1, 2)}
+
+        cases = [(path, data) for path in [
+            "", "/", ".", "/a/0", "/a/-1", "/a/-3", "/a/2", "/a/1/b", "/a/1/c",
+            "/s/x", "/t/1", "/t/5", "/a/1/b/c", "/a/1/..", "/a[0:1]", "/x[0:1]",
+        ]]
+        # Root references resolve on any document, scalars included
+        cases += [(path, doc) for path in ("", "/", ".") for doc in (42, None, [])]
+
+        for path, doc in cases:
+            try:
+                resolver.get(path, doc)
+                expected = True
+            except (KeyError, IndexError, TypeError):
+                expected = False
+            assert resolver.exists(path, doc) is expected, (path, doc)
+
 
 class TestPointerResolverEdgeCases:
     """Additional edge case tests for uncovered paths."""
@@ -265,3 +285,51 @@ class TestPointerResolverEdgeCases:
 
         with pytest.raises(KeyError):
             resolver.delete("/a/b/c", data)
+
+    def test_escaped_dots_are_a_key_not_parent_navigation(self):
+        """'~3~3' decodes to a literal '..' key; only a raw '..' navigates up."""
+        resolver = PointerResolver()
+        data = {"a": {"..": 1, "b": 2}}
+
+        assert resolver.get("/a/~3~3", data) == 1
+        assert resolver.get("/a/b/..", data) == data["a"]
+        resolver.set("/a/~3~3", data, 3)
+        assert data["a"][".."] == 3
+
+    def test_repeated_pointer_uses_parsed_form(self):
+        """Parsed pointers are memoised, and repeated lookups stay correct."""
+        from j_perm.resolvers.pointer import _parse_pointer
+
+        resolver = PointerResolver()
+        _parse_pointer.cache_clear()
+        for i in range(3):
+            assert resolver.get("/arr/1", {"arr": [0, i]}) == i
+        info = _parse_pointer.cache_info()
+        assert info.misses == 1 and info.hits == 2
+
+    def test_numeric_tokens_are_pre_converted(self):
+        """Numeric tokens index lists directly but stay string keys on dicts."""
+        from j_perm.resolvers.pointer import _parse_pointer, _parse_parent_path
+
+        assert _parse_pointer("/a/0/b/..") == ((("a", None), ("0", 0), ("b", None), None), True)
+        assert _parse_parent_path("/a/1/x") == ((("a", None), ("1", 1)), "x")
+        assert _parse_parent_path("/a/..") == ((), "")
+
+        resolver = PointerResolver()
+        data = {"0": {"1": "dict"}, "l": [[0, "list"]]}
+        assert resolver.get("/0/1", data) == "dict"
+        assert resolver.get("/l/0/1", data) == "list"
+        assert resolver.get("/l/0/1/..", data) == [0, "list"]
+        resolver.set("/l/0/1", data, "new")
+        assert data["l"][0][1] == "new"
+
+    def test_non_numeric_list_token_still_raises(self):
+        """A non-numeric token against a list keeps raising ValueError."""
+        resolver = PointerResolver()
+
+        with pytest.raises(ValueError):
+            resolver.get("/l/x", {"l": [1]})
+        with pytest.raises(ValueError):
+            resolver.get("/l/x/..", {"l": [1]})
+        with pytest.raises(ValueError):
+            resolver.set("/l/x/y", {"l": [1]}, 1)
@@ -239,3 +239,16 @@ class TestMixedShorthands:
         )
 
         assert result == {"x": 1}
+
+    def test_steps_without_the_stage_key_pass_through_untouched(self):
+        """Assert/delete processors keep unrelated steps as the same objects."""
+        from j_perm.stages.shorthands import AssertShorthandProcessor, DeleteShorthandProcessor
+
+        other = {"/x": 1}
+        steps = [other, {"~assert": "/a", "~delete": "/b", "/y": 2}]
+        after_assert = AssertShorthandProcessor().apply(steps, None)
+        assert after_assert[0] is other
+        assert after_assert[1:] == [{"op": "assert", "path": "/a"}, {"~delete": "/b", "/y": 2}]
+        after_delete = DeleteShorthandProcessor().apply(after_assert, None)
+        assert after_delete[0] is other
+        assert after_delete[2:] == [{"op": "delete", "path": "/b"}, {"/y": 2}]
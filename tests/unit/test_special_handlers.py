@@ -1129,3 +1129,15 @@ class TestSpecialResolveHandlerFallback:
         ctx = ExecutionContext(source={}, dest={}, engine=FakeEngine())
         result = handler.execute(step, ctx)
         assert result == {"$unknown": "value"}
+
+    def test_earliest_registered_key_wins(self):
+        """With several special keys in one step, registration order decides."""
+        from j_perm import SpecialResolveHandler, ExecutionContext
+
+        handler = SpecialResolveHandler({
+            "$first": lambda node, ctx: "first",
+            "$second": lambda node, ctx: "second",
+        })
+        ctx = ExecutionContext(source={}, dest={}, engine=None)
+        assert handler.execute({"$second": 1, "$first": 2}, ctx) == "first"
+        assert handler.execute({"$other": 0, "$second": 1}, ctx) == "second"
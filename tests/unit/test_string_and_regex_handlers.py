@@ -394,6 +394,27 @@ class TestRegexOperations:
 
         assert result == {"result": False}
 
+    def test_regex_compiled_once_across_handlers(self):
+        """All regex handlers share one compiled pattern per (pattern, flags)."""
+        from j_perm.handlers.constructs import _compile_regex
+
+        engine = build_default_engine()
+        _compile_regex.cache_clear()
+
+        result = engine.apply(
+            [
+                {"/m": {"$regex_match": {"pattern": "a(\\d)", "string": "a1"}}},
+                {"/s": {"$regex_search": {"pattern": "a(\\d)", "string": "xa2"}}},
+                {"/g": {"$regex_groups": {"pattern": "a(\\d)", "string": "a3"}}},
+            ],
+            source={},
+            dest={},
+        )
+
+        assert result == {"m": True, "s": "a2", "g": ["3"]}
+        info = _compile_regex.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
     def test_regex_search_found(self):
         """$regex_search returns matched string."""
         engine = build_default_engine()
@@ -256,3 +256,38 @@ class TestTemplateUnescapeEdgeCases:
         result = template_unescape(("$$hello", "$$world"))
         assert result == ("$hello", "$world")
         assert isinstance(result, tuple)
+
+
+class TestSplitTemplate:
+    """Parsed template segments are memoised and keep escapes verbatim."""
+
+    def test_segments(self):
+        from j_perm.handlers.template import _split_template
+
+        assert _split_template("a ${/x} b") == ((False, "a "), (True, "/x"), (False, " b"))
+        assert _split_template("$${/x}$$${/y}") == ((False, "$${/x}$$"), (True, "/y"))
+        assert _split_template("${a${/x}") == ((False, "${a"), (True, "/x"))
+        assert _split_template("${/x}") == ((True, "/x"),)
+
+    def test_memoised(self):
+        from j_perm.handlers.template import _split_template
+
+        assert _split_template("k=${/k}") is _split_template("k=${/k}")
+
+    def test_long_templates_are_not_retained(self):
+        from j_perm.handlers.template import (
+            _SPLIT_CACHE_MAX_LEN, _parse_template_cached, _split_template,
+        )
+
+        long_tmpl = "x" * _SPLIT_CACHE_MAX_LEN + "${/k}"
+        before = _parse_template_cached.cache_info().currsize
+        assert _split_template(long_tmpl) == ((False, "x" * _SPLIT_CACHE_MAX_LEN), (True, "/k"))
+        assert _split_template(long_tmpl) is not _split_template(long_tmpl)
+        assert _parse_template_cached.cache_info().currsize == before
+
+    def test_repeated_apply_uses_current_values(self):
+        engine = build_default_engine()
+        spec = {"/r": "${/a}-${int:/b}"}
+
+        assert engine.apply(spec, source={"a": "x", "b": "1"}, dest={}) == {"r": "x-1"}
+        assert engine.apply(spec, source={"a": "y", "b": "2"}, dest={}) == {"r": "y-2"}